@@ -1,26 +1,51 @@
-import re
+from itertools import islice
 from datetime import datetime, timezone
 from loguru import logger
+from core.iso_dates import iso_to_epoch
 from models.assessment import Finding, Severity, FindingCategory
 
-_UUID_RE = re.compile(
-    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.IGNORECASE
-)
+_HEX = frozenset("0123456789abcdefABCDEF")
 
 def _is_readable_name(name: str) -> bool:
-    if not name or not name.strip():
+    if not name:
         return False
-    if _UUID_RE.match(name.strip()):
+    s = name.strip()
+    if not s:
         return False
-    return True
+    # Prefijo UUID 8-4-4-4-12: guiones en posiciones fijas y el resto hex
+    if len(s) < 36 or s[8] != "-" or s[13] != "-" or s[18] != "-" or s[23] != "-":
+        return True
+    return not _HEX.issuperset(s[:8] + s[9:13] + s[14:18] + s[19:23] + s[24:36])
 
 
-def _truncate_evidence(items: list, max_items: int = 5) -> str:
-    readable = [str(i) for i in items if _is_readable_name(str(i))]
-    total = len(items)
-    if not readable:
+_DAY_SECONDS = 86400
+
+
+_ID_FMT = "F-{:03d}".format
+# IDs pregenerados F-001..F-1023; más allá se formatea al vuelo
+_FINDING_IDS = tuple(_ID_FMT(i) for i in range(1, 1024))
+
+_CLOUD_SOURCES = frozenset({"CloudDiscoveryConnector", "AWS", "AZURE", "GCP"})
+
+
+def _asset_name(a: dict) -> str:
+    return (a.get("name") or a.get("fqdn") or
+            a.get("hostname") or a.get("ipv4") or "unknown")
+
+
+def _pct(count: int, total: int) -> float:
+    # Porcentaje a 1 decimal; 0.0 si no hay universo (evita ZeroDivisionError)
+    return round(count / total * 100, 1) if total else 0.0
+
+
+def _truncate_evidence(items, total: int | None = None, max_items: int = 5) -> str:
+    # items puede ser un generador: solo se materializan max_items nombres legibles
+    if total is None:
+        total = len(items)
+    readable = (n for n in map(str, items) if _is_readable_name(n))
+    sample = list(islice(readable, max_items))
+    if not sample:
         return f"{total} items (names not available)"
-    sample = readable[:max_items]
     remaining = total - len(sample)
     if remaining > 0:
         return f"{', '.join(sample)} (+ {remaining} more)"
@@ -28,8 +53,23 @@ def _truncate_evidence(items: list, max_items: int = 5) -> str:
 
 
 class GapAnalyzer:
+    # Orden de ejecución (define la numeración F-001, F-002, ...)
+    _CHECKS = (
+        "scanner_health",
+        "scanner_linking",
+        "credential_coverage",
+        "credentials_configured",
+        "networks",
+        "asset_staleness",
+        "asset_tagging",
+        "scan_frequency",
+    )
+    _SCANNER_CHECKS = frozenset({"scanner_health", "scanner_linking"})
+    _ASSET_CHECKS = frozenset({"asset_staleness", "asset_tagging"})
+    _SCAN_CHECKS  = frozenset({"credential_coverage", "scan_frequency"})
+
     def __init__(self, scanners, assets, scans, policies, tags,
-                 credentials=None, networks=None):
+                 credentials=None, networks=None, skip=None):
         self.scanners    = scanners
         self.assets      = assets
         self.scans       = scans
@@ -39,67 +79,170 @@ class GapAnalyzer:
         self.networks    = networks    or []
         self.findings    = []
         self._counter    = 0
+        # Nombres de _CHECKS a omitir, p.ej. {"networks"}
+        self.skip        = frozenset(skip or ())
+        unknown = self.skip.difference(self._CHECKS)
+        if unknown:
+            raise ValueError(
+                f"Unknown check(s) in skip: {', '.join(sorted(unknown))}. "
+                f"Valid: {', '.join(self._CHECKS)}"
+            )
 
     def run_all_checks(self):
         logger.info("Running gap analysis checks...")
-        self._check_scanner_health()
-        self._check_scanner_linking()
-        self._check_credential_coverage()
-        self._check_credentials_configured()
-        self._check_networks()
-        self._check_asset_staleness()
-        self._check_asset_tagging()
-        self._check_scan_frequency()
-        logger.info(f"Gap analysis complete: {len(self.findings)} findings.")
+        self._n_assets = len(self.assets)
+        self._n_scans  = len(self.scans)
+        # Un solo now() por corrida; (now - dt).days > N  <=>  dt <= now - (N + 1) días
+        self._now        = datetime.now(timezone.utc).timestamp()
+        self._cutoff_90d = self._now - 91 * _DAY_SECONDS
+        self._cutoff_30d = self._now - 31 * _DAY_SECONDS
+
+        checks = [c for c in self._CHECKS if c not in self.skip]
+        if self.scanners and not self._SCANNER_CHECKS.isdisjoint(checks):
+            self._scan_scanners()
+        if self.assets and not self._ASSET_CHECKS.isdisjoint(checks):
+            self._scan_assets()
+        if self.scans and not self._SCAN_CHECKS.isdisjoint(checks):
+            self._scan_scans()
+        for name in checks:
+            getattr(self, f"_check_{name}")()
+
+        logger.info("Gap analysis complete: {} findings.", len(self.findings))
         return self.findings
 
+    # ------------------------------------------------------------------
+    # Pasada única por colección — los _check_* solo formatean agregados
+    # ------------------------------------------------------------------
+    def _scan_scanners(self):
+        offline, unlinked = [], []
+        for s in self.scanners:
+            get = s.get
+            if get("status") != "on":
+                offline.append(s)
+            if not get("linked"):
+                unlinked.append(s)
+        self._offline_scanners  = offline
+        self._unlinked_scanners = unlinked
+
+    def _scan_assets(self):
+        cutoff_90 = self._cutoff_90d
+        cutoff_30 = self._cutoff_30d
+
+        zombies, stale, cloud_unscanned, no_auth_scan = [], [], [], []
+        untagged = 0
+        # Locales en vez de LOAD_GLOBAL/LOAD_ATTR por fila
+        parse = iso_to_epoch
+        add_zombie, add_stale = zombies.append, stale.append
+        add_cloud, add_no_auth = cloud_unscanned.append, no_auth_scan.append
+        for a in self.assets:
+            get = a.get
+            # Tier 1: Zombie > 90 días sin actividad (sin last_seen o no parseable cuenta)
+            # Tier 2: Stale 30-90 días
+            seen = parse(get("last_seen"))
+            if seen is None or seen <= cutoff_90:
+                add_zombie(a)
+            elif seen <= cutoff_30:
+                add_stale(a)
+
+            # Tier 4: con plugin results pero sin autenticación real
+            # Tier 3: Cloud assets nunca escaneados
+            if not get("last_authenticated_scan_date"):
+                if get("has_plugin_results"):
+                    add_no_auth(a)
+                elif get("source") in _CLOUD_SOURCES:
+                    add_cloud(a)
+
+            if not get("tags"):
+                untagged += 1
+
+        self._zombie_assets   = zombies
+        self._stale_assets    = stale
+        self._cloud_unscanned = cloud_unscanned
+        self._no_auth_assets  = no_auth_scan
+        self._untagged_count  = untagged
+
+    def _scan_scans(self):
+        cutoff_30 = self._cutoff_30d
+
+        ghosts, unauthenticated, stale = [], [], []
+        active = 0
+        parse = iso_to_epoch
+        add_ghost, add_unauth, add_stale = ghosts.append, unauthenticated.append, stale.append
+        for scan in self.scans:
+            get = scan.get
+            if get("is_ghost"):
+                add_ghost(scan)
+            else:
+                active += 1
+                if not get("credential_enabled"):
+                    add_unauth(scan)
+
+            name = get("name")
+            if not name or get("enabled") is False:
+                continue
+            # Sin last_run o no parseable cuenta como no ejecutado
+            last_run = parse(get("last_run"))
+            if last_run is None or last_run <= cutoff_30:
+                add_stale(name)
+
+        self._ghost_scans        = ghosts
+        self._active_scan_count  = active
+        self._unauth_scans       = unauthenticated
+        self._stale_scan_names   = stale
+
     def _check_scanner_health(self):
-        offline = [s for s in self.scanners if s.get("status") != "on"]
+        if not self.scanners:
+            return
+        offline = self._offline_scanners
         if offline:
             self._add(
                 title=f"{len(offline)} Scanner(s) Offline",
                 category=FindingCategory.SCANNER_HEALTH,
                 severity=Severity.HIGH,
                 description="Offline scanners create blind spots in coverage.",
-                evidence=_truncate_evidence([s["name"] for s in offline]),
+                evidence=_truncate_evidence((s["name"] for s in offline), len(offline)),
                 recommendation="Restore offline scanners and verify connectivity.",
                 effort="medium"
             )
 
     def _check_scanner_linking(self):
-        unlinked = [s for s in self.scanners if not s.get("linked")]
+        if not self.scanners:
+            return
+        unlinked = self._unlinked_scanners
         if unlinked:
             self._add(
                 title=f"{len(unlinked)} Scanner(s) Not Linked to TVM",
                 category=FindingCategory.SCANNER_HEALTH,
                 severity=Severity.CRITICAL,
                 description="Unlinked scanners cannot run scans or report findings.",
-                evidence=_truncate_evidence([s["name"] for s in unlinked]),
+                evidence=_truncate_evidence((s["name"] for s in unlinked), len(unlinked)),
                 recommendation="Re-link scanners using a valid Linking Key from Tenable.io.",
                 effort="low"
             )
 
     def _check_credential_coverage(self):
+        if not self.scans:
+            return
         # Scans fantasma — nunca han corrido (status=empty)
-        ghosts = [s for s in self.scans if s.get("is_ghost")]
+        ghosts = self._ghost_scans
         # Scans activos sin credenciales
-        active = [s for s in self.scans if not s.get("is_ghost")]
-        unauthenticated = [s for s in active if not s.get("credential_enabled")]
-        total = len(self.scans)
+        unauthenticated = self._unauth_scans
+        total = self._n_scans
+        n_ghosts, n_unauth = len(ghosts), len(unauthenticated)
 
         # Finding 1: Scans Fantasma
         if ghosts:
-            ghost_pct = round(len(ghosts) / total * 100, 1)
+            ghost_pct = _pct(n_ghosts, total)
             self._add(
-                title=f"{len(ghosts)} Ghost Scan(s) — Never Executed ({ghost_pct}%)",
+                title=f"{n_ghosts} Ghost Scan(s) — Never Executed ({ghost_pct}%)",
                 category=FindingCategory.CREDENTIAL_COVERAGE,
                 severity=Severity.CRITICAL,
                 description=(
-                    f"{len(ghosts)} of {total} scans ({ghost_pct}%) have status 'empty' — "
+                    f"{n_ghosts} of {total} scans ({ghost_pct}%) have status 'empty' — "
                     "they were created but have NEVER run. They consume scan slots, "
                     "inflate the scan count, and provide zero security coverage."
                 ),
-                evidence=_truncate_evidence([s["name"] for s in ghosts], max_items=5),
+                evidence=_truncate_evidence((s["name"] for s in ghosts), n_ghosts),
                 recommendation=(
                     "Audit and delete ghost scans. Keep only scans with an active schedule. "
                     "Implement a scan hygiene policy: delete any scan unused for 90+ days."
@@ -109,18 +252,18 @@ class GapAnalyzer:
 
         # Finding 2: Scans activos sin credenciales
         if unauthenticated:
-            active_total = len(active)
-            pct = round(len(unauthenticated) / active_total * 100, 1) if active_total else 0
+            active_total = self._active_scan_count
+            pct = _pct(n_unauth, active_total)
             self._add(
-                title=f"{len(unauthenticated)} Active Scan(s) Without Credentials",
+                title=f"{n_unauth} Active Scan(s) Without Credentials",
                 category=FindingCategory.CREDENTIAL_COVERAGE,
                 severity=Severity.CRITICAL if pct > 50 else Severity.HIGH,
                 description=(
-                    f"{len(unauthenticated)} of {active_total} active scans ({pct}%) run "
+                    f"{n_unauth} of {active_total} active scans ({pct}%) run "
                     "unauthenticated. Unauthenticated scans detect only ~30% of vulnerabilities. "
-                    f"({len(active) - len(unauthenticated)} active scans have credentials.)"
+                    f"({active_total - n_unauth} active scans have credentials.)"
                 ),
-                evidence=_truncate_evidence([s["name"] for s in unauthenticated], max_items=5),
+                evidence=_truncate_evidence((s["name"] for s in unauthenticated), n_unauth),
                 recommendation="Configure credential sets for all internal network scans.",
                 effort="high"
             )
@@ -150,9 +293,16 @@ class GapAnalyzer:
                     return str(c.get("type", "Unknown")) if hasattr(c, "get") else str(c)
                 except Exception:
                     return "Unknown"
-            types = list({_ctype(c) for c in self.credentials})
-            has_windows = any("windows" in _ctype(c).lower() for c in self.credentials)
-            has_ssh     = any("ssh" in _ctype(c).lower() for c in self.credentials)
+            # Una sola pasada: tipos únicos + detección Windows/SSH
+            type_set = set()
+            has_windows = has_ssh = False
+            for c in self.credentials:
+                t = _ctype(c)
+                type_set.add(t)
+                tl = t.lower()
+                has_windows = has_windows or "windows" in tl
+                has_ssh     = has_ssh or "ssh" in tl
+            types = list(type_set)
             missing = []
             if not has_windows:
                 missing.append("Windows")
@@ -177,10 +327,7 @@ class GapAnalyzer:
     def _check_networks(self):
         if not self.networks:
             return
-        default_only = all(n.get("is_default", False) for n in self.networks)
-        empty_networks = [n for n in self.networks if n.get("asset_count", 0) == 0
-                         and not n.get("is_default")]
-        if default_only and len(self.networks) == 1:
+        if len(self.networks) == 1 and self.networks[0].get("is_default", False):
             self._add(
                 title="Only Default Network Configured",
                 category=FindingCategory.ASSET_COVERAGE,
@@ -196,8 +343,13 @@ class GapAnalyzer:
                 ),
                 effort="medium"
             )
-        elif empty_networks:
-            names = _truncate_evidence([n["name"] for n in empty_networks])
+            return
+
+        # Solo se recorren las redes si el caso "solo Default" no aplicó
+        empty_networks = [n for n in self.networks if n.get("asset_count", 0) == 0
+                         and not n.get("is_default")]
+        if empty_networks:
+            names = _truncate_evidence((n["name"] for n in empty_networks), len(empty_networks))
             self._add(
                 title=f"{len(empty_networks)} Network(s) With No Assets",
                 category=FindingCategory.ASSET_COVERAGE,
@@ -212,56 +364,28 @@ class GapAnalyzer:
             )
 
     def _check_asset_staleness(self):
-        now = datetime.now(timezone.utc)
-
-        def days_since(iso_str):
-            if not iso_str:
-                return 999
-            try:
-                return (now - datetime.fromisoformat(iso_str.replace("Z", "+00:00"))).days
-            except Exception:
-                return 999
-
-        def asset_name(a):
-            return (a.get("name") or a.get("fqdn") or
-                    a.get("hostname") or a.get("ipv4") or "unknown")
-
-        total = len(self.assets)
-
-        # Tier 1: Zombie > 90 días sin actividad
-        zombies = [a for a in self.assets if days_since(a.get("last_seen")) > 90]
-
-        # Tier 2: Stale 30-90 días
-        stale = [a for a in self.assets
-                 if 30 < days_since(a.get("last_seen")) <= 90]
-
-        # Tier 3: Cloud assets nunca escaneados
-        cloud_unscanned = [
-            a for a in self.assets
-            if a.get("source") in ("CloudDiscoveryConnector", "AWS", "AZURE", "GCP")
-            and not a.get("last_authenticated_scan_date")
-            and not a.get("has_plugin_results")
-        ]
-
-        # Tier 4: Assets sin autenticación real (last_authenticated_scan_date=None)
-        no_auth_scan = [
-            a for a in self.assets
-            if not a.get("last_authenticated_scan_date")
-            and a.get("has_plugin_results")
-        ]
+        if not self.assets:
+            return
+        total           = self._n_assets
+        zombies         = self._zombie_assets
+        stale           = self._stale_assets
+        cloud_unscanned = self._cloud_unscanned
+        no_auth_scan    = self._no_auth_assets
+        n_zombies, n_stale = len(zombies), len(stale)
+        n_cloud, n_no_auth = len(cloud_unscanned), len(no_auth_scan)
 
         if zombies:
-            pct = round(len(zombies) / total * 100, 1)
+            pct = _pct(n_zombies, total)
             self._add(
-                title=f"{len(zombies)} Zombie Asset(s) — No Activity >90 Days ({pct}%)",
+                title=f"{n_zombies} Zombie Asset(s) — No Activity >90 Days ({pct}%)",
                 category=FindingCategory.ASSET_COVERAGE,
                 severity=Severity.CRITICAL if pct > 30 else Severity.HIGH,
                 description=(
-                    f"{len(zombies)} assets ({pct}%) have not been seen in 90+ days. "
+                    f"{n_zombies} assets ({pct}%) have not been seen in 90+ days. "
                     "These zombie assets consume licenses without generating security value. "
                     "They represent either decommissioned systems or coverage blind spots."
                 ),
-                evidence=_truncate_evidence([asset_name(a) for a in zombies], max_items=5),
+                evidence=_truncate_evidence(map(_asset_name, zombies), n_zombies),
                 recommendation=(
                     "Enable Asset Aging policy in Tenable (Settings > General > Asset Management). "
                     "Set auto-delete for assets not seen in 90 days. "
@@ -271,31 +395,31 @@ class GapAnalyzer:
             )
 
         if stale:
-            pct = round(len(stale) / total * 100, 1)
+            pct = _pct(n_stale, total)
             self._add(
-                title=f"{len(stale)} Stale Asset(s) — No Activity 30-90 Days ({pct}%)",
+                title=f"{n_stale} Stale Asset(s) — No Activity 30-90 Days ({pct}%)",
                 category=FindingCategory.ASSET_COVERAGE,
                 severity=Severity.MEDIUM,
                 description=(
-                    f"{len(stale)} assets ({pct}%) have not been seen in 30-90 days. "
+                    f"{n_stale} assets ({pct}%) have not been seen in 30-90 days. "
                     "These may indicate intermittent connectivity or scanner coverage gaps."
                 ),
-                evidence=_truncate_evidence([asset_name(a) for a in stale], max_items=5),
+                evidence=_truncate_evidence(map(_asset_name, stale), n_stale),
                 recommendation="Verify scanner reachability for these assets. Check scan schedules.",
                 effort="low"
             )
 
         if cloud_unscanned:
             self._add(
-                title=f"{len(cloud_unscanned)} Cloud Asset(s) Never Scanned",
+                title=f"{n_cloud} Cloud Asset(s) Never Scanned",
                 category=FindingCategory.ASSET_COVERAGE,
                 severity=Severity.HIGH,
                 description=(
-                    f"{len(cloud_unscanned)} cloud assets were discovered via connector "
+                    f"{n_cloud} cloud assets were discovered via connector "
                     "but have never been scanned. Cloud assets without scan results "
                     "provide zero vulnerability intelligence."
                 ),
-                evidence=_truncate_evidence([asset_name(a) for a in cloud_unscanned], max_items=5),
+                evidence=_truncate_evidence(map(_asset_name, cloud_unscanned), n_cloud),
                 recommendation=(
                     "Deploy cloud-native scanners or Tenable Agents to cover cloud assets. "
                     "Enable cloud connector scanning in Tenable Cloud Security."
@@ -303,28 +427,30 @@ class GapAnalyzer:
                 effort="medium"
             )
 
-        if no_auth_scan and len(no_auth_scan) > 3:
-            pct = round(len(no_auth_scan) / total * 100, 1)
+        if no_auth_scan and n_no_auth > 3:
+            pct = _pct(n_no_auth, total)
             self._add(
-                title=f"{len(no_auth_scan)} Asset(s) Never Authenticated ({pct}%)",
+                title=f"{n_no_auth} Asset(s) Never Authenticated ({pct}%)",
                 category=FindingCategory.ASSET_COVERAGE,
                 severity=Severity.MEDIUM,
                 description=(
-                    f"{len(no_auth_scan)} assets ({pct}%) have plugin results but "
+                    f"{n_no_auth} assets ({pct}%) have plugin results but "
                     "have never had a successful authenticated scan. "
                     "Authenticated scans detect 2-3x more vulnerabilities."
                 ),
-                evidence=_truncate_evidence([asset_name(a) for a in no_auth_scan], max_items=5),
+                evidence=_truncate_evidence(map(_asset_name, no_auth_scan), n_no_auth),
                 recommendation="Configure and enable credential scanning for these assets.",
                 effort="high"
             )
 
     def _check_asset_tagging(self):
-        untagged = [a for a in self.assets if not a.get("tags")]
+        if not self.assets:
+            return
+        untagged = self._untagged_count
         if untagged:
-            pct = round(len(untagged) / len(self.assets) * 100, 1)
+            pct = _pct(untagged, self._n_assets)
             self._add(
-                title=f"{len(untagged)} Assets Without Tags ({pct}%)",
+                title=f"{untagged} Assets Without Tags ({pct}%)",
                 category=FindingCategory.TAG_MANAGEMENT,
                 severity=Severity.MEDIUM if pct < 50 else Severity.HIGH,
                 description="Untagged assets cannot be targeted by dynamic access groups.",
@@ -334,34 +460,21 @@ class GapAnalyzer:
             )
 
     def _check_scan_frequency(self):
-        now = datetime.now(timezone.utc)
-        stale = []
-        for scan in self.scans:
-            if not scan.get("name"):
-                continue
-            if scan.get("enabled") is False:
-                continue
-            last_run = scan.get("last_run")
-            if not last_run:
-                stale.append(scan["name"])
-                continue
-            try:
-                last_dt = datetime.fromisoformat(last_run.replace("Z", "+00:00"))
-                if (now - last_dt).days > 30:
-                    stale.append(scan["name"])
-            except (ValueError, TypeError):
-                stale.append(scan.get("name", "unknown"))
+        if not self.scans:
+            return
+        stale = self._stale_scan_names
+        n_stale = len(stale)
 
         if stale:
             self._add(
-                title=f"{len(stale)} Scan(s) Not Run in 30+ Days",
+                title=f"{n_stale} Scan(s) Not Run in 30+ Days",
                 category=FindingCategory.SCAN_POLICY,
-                severity=Severity.CRITICAL if len(stale) > 100 else Severity.HIGH,
+                severity=Severity.CRITICAL if n_stale > 100 else Severity.HIGH,
                 description=(
-                    f"{len(stale)} scans have not executed in the last 30 days. "
+                    f"{n_stale} scans have not executed in the last 30 days. "
                     "This may indicate scheduling issues or abandoned scan configurations."
                 ),
-                evidence=f"Sample: {_truncate_evidence(stale, max_items=5)}",
+                evidence=f"Sample: {_truncate_evidence(stale)}",
                 recommendation=(
                     "Review and clean up abandoned scans. "
                     "Enable weekly schedules for all active scan policies."
@@ -371,9 +484,10 @@ class GapAnalyzer:
 
     def _add(self, title, category, severity, description,
              recommendation, effort, evidence=None):
-        self._counter += 1
+        n = self._counter
+        self._counter = n + 1
         self.findings.append(Finding(
-            id=f"F-{self._counter:03d}",
+            id=_FINDING_IDS[n] if n < len(_FINDING_IDS) else _ID_FMT(n + 1),
             title=title,
             category=category,
             severity=severity,
@@ -1,39 +1,90 @@
-import os
+from functools import lru_cache
+from pathlib import Path
+
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich import box
+from rich.console import Console, Group
 from config.settings import settings
 
+# rich.table / rich.panel / rich.progress se importan dentro de cada comando:
+# `--help` solo necesita click y la consola.
+
 console = Console()
 
-LOGO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'assets', 'mpiv_logo.png')
+LOGO_PATH = Path(__file__).resolve().parent.parent / "assets" / "mpiv_logo.png"
 
 
-def banner():
-    console.print(f"""
+@lru_cache(maxsize=1)
+def _logo_path():
+    """Logo path if the file exists, else None (stat once per process)."""
+    return str(LOGO_PATH) if LOGO_PATH.exists() else None
+
+_SEV_COLORS = {
+    "critical": "bold red", "high": "bold orange3",
+    "medium": "bold yellow", "low": "bold green",
+}
+_BORDER_COLORS = {
+    "critical": "red", "high": "orange3",
+    "medium": "yellow", "low": "green",
+}
+_TYPE_COLORS = {"quick-win": "green", "strategic": "blue", "roadmap": "magenta"}
+# (umbral mínimo, color) de mayor a menor; por debajo → red
+_SCORE_THRESHOLDS = ((3.5, "green"), (2.5, "yellow"))
+
+_SUMMARY_TEMPLATE = (
+    "[bold]Customer:[/bold] {customer}\n"
+    "[bold]Maturity:[/bold] [{color}]{level} ({score}/5.0)[/{color}]\n"
+    "[bold]Assets:[/bold] {assets}\n"
+    "[bold]Auth. Coverage:[/bold] {auth:.1f}%\n"
+    "[bold]Scanner Health:[/bold] {health:.1f}%\n"
+    "[bold]Critical:[/bold] [red]{critical}[/red]  "
+    "[bold]High:[/bold] [orange3]{high}[/orange3]  "
+    "[bold]Total:[/bold] {total}"
+)
+
+
+_BANNER = f"""
 [bold blue]╔══════════════════════════════════════════════╗
 ║   MPIV TVM Advisor  v{settings.VERSION}                  ║
 ║   Tenable Health Check Platform              ║
 ╚══════════════════════════════════════════════╝[/bold blue]
-""")
+"""
+
+
+def _spinner():
+    """Transient spinner shared by assess and connect (4 Hz, cleared on exit).
+
+    Disabled without a TTY: no refresh thread and no frames in the output.
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    return Progress(SpinnerColumn(spinner_name="dots"), TextColumn("{task.description}"),
+                    console=console, refresh_per_second=4, transient=True,
+                    disable=not console.is_terminal)
+
+
+def banner():
+    if not console.is_terminal:
+        # Salida redirigida (cron/CI): una línea sin cajas ni colores
+        mode = "MOCK" if settings.MOCK_MODE else "LIVE"
+        lines = [f"{settings.APP_NAME} v{settings.VERSION} — "
+                 f"{settings.CUSTOMER_NAME} ({settings.ENGAGEMENT_ID}) — {mode}"]
+        lines += [f"  ⚠  {w}" for w in settings.validate()]
+        # Una sola escritura para todo el bloque
+        console.print("\n".join(lines) + "\n")
+        return
     mode = "[yellow]MOCK[/yellow]" if settings.MOCK_MODE else "[green]LIVE[/green]"
-    console.print(
+    lines = [
+        _BANNER,
         f"  Mode: {mode}  |  "
         f"Customer: [bold]{settings.CUSTOMER_NAME}[/bold]  |  "
-        f"ID: {settings.ENGAGEMENT_ID}\n"
-    )
-    for w in settings.validate():
-        console.print(f"  [yellow]⚠  {w}[/yellow]")
-    console.print()
+        f"ID: {settings.ENGAGEMENT_ID}\n",
+    ]
+    lines += [f"  [yellow]⚠  {w}[/yellow]" for w in settings.validate()]
+    console.print("\n".join(lines) + "\n")
 
 
 @click.group()
 def cli():
     """MPIV Tenable TVM Advisor — Health Check CLI"""
-    banner()
 
 
 @cli.command("assess")
@@ -41,31 +92,35 @@ def cli():
 @click.option("--verbose", "-v", is_flag=True, default=False, help="Show finding details")
 def run_assessment(no_pdf, verbose):
     """Run full TVM Health Check assessment."""
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    from models.assessment import Severity
     from services.assessment_service import AssessmentService
     from reporting.pdf_report import PDFReportGenerator
 
-    with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as p:
+    banner()
+
+    with _spinner() as p:
         t = p.add_task("Collecting Tenable data...", total=None)
         service = AssessmentService()
         p.update(t, description="Running gap analysis...")
         summary = service.run()
         p.update(t, description="Assessment complete!")
 
-    score_color = (
-        "green" if summary.maturity_score >= 3.5
-        else "yellow" if summary.maturity_score >= 2.5
-        else "red"
-    )
+    score_color = next(
+        (c for t, c in _SCORE_THRESHOLDS if summary.maturity_score >= t), "red")
+    sev_counts = summary.severity_counts
     console.print(Panel(
-        f"[bold]Customer:[/bold] {summary.customer_name}\n"
-        f"[bold]Maturity:[/bold] [{score_color}]{summary.maturity_level.value} "
-        f"({summary.maturity_score}/5.0)[/{score_color}]\n"
-        f"[bold]Assets:[/bold] {summary.total_assets}\n"
-        f"[bold]Auth. Coverage:[/bold] {summary.authenticated_scans_pct:.1f}%\n"
-        f"[bold]Scanner Health:[/bold] {summary.scanner_health_pct:.1f}%\n"
-        f"[bold]Critical:[/bold] [red]{len(summary.critical_findings)}[/red]  "
-        f"[bold]High:[/bold] [orange3]{len(summary.high_findings)}[/orange3]  "
-        f"[bold]Total:[/bold] {len(summary.findings)}",
+        _SUMMARY_TEMPLATE.format(
+            customer=summary.customer_name, color=score_color,
+            level=summary.maturity_level.value, score=summary.maturity_score,
+            assets=summary.total_assets, auth=summary.authenticated_scans_pct,
+            health=summary.scanner_health_pct,
+            critical=sev_counts[Severity.CRITICAL], high=sev_counts[Severity.HIGH],
+            total=len(summary.findings),
+        ),
         title="[bold blue]Assessment Summary[/bold blue]"
     ))
 
@@ -76,39 +131,36 @@ def run_assessment(no_pdf, verbose):
         tbl.add_column("SEV", width=10)
         tbl.add_column("Category", width=22)
         tbl.add_column("Title")
-        sev_colors = {
-            "critical": "bold red", "high": "bold orange3",
-            "medium": "bold yellow", "low": "bold green",
-        }
         for f in summary.findings:
-            sc = sev_colors.get(f.severity.value, "")
-            tbl.add_row(f.id, f"[{sc}]{f.severity.upper()}[/{sc}]",
+            # Text con estilo directo: la celda no pasa por el parser de markup
+            tbl.add_row(f.id,
+                        Text(f.severity.value.upper(), style=_SEV_COLORS.get(f.severity.value, "")),
                         f.category.value, f.title)
         console.print(tbl)
 
         if verbose:
             console.print("\n[bold]Finding Details[/bold]\n")
-            border_colors = {
-                "critical": "red", "high": "orange3",
-                "medium": "yellow", "low": "green",
-            }
-            for f in summary.findings:
-                bc = border_colors.get(f.severity.value, "white")
-                console.print(Panel(
+            # Un solo console.print para todos los paneles (un pase de render)
+            console.print(Group(*(
+                Panel(
                     f"[bold]Description:[/bold] {f.description}\n\n"
                     f"[bold]Evidence:[/bold] {f.evidence or 'N/A'}\n\n"
                     f"[bold]Recommendation:[/bold] {f.recommendation}\n\n"
                     f"[bold]Effort:[/bold] {f.effort.upper()}",
                     title=f"[bold]{f.id} — {f.title}[/bold]",
-                    border_style=bc,
-                ))
+                    border_style=_BORDER_COLORS.get(f.severity.value, "white"),
+                )
+                for f in summary.findings
+            )))
 
     if summary.recommendations:
         console.print(f"\n[bold]Recommendations[/bold]\n")
-        type_colors = {"quick-win": "green", "strategic": "blue", "roadmap": "magenta"}
+        lines = []
         for r in summary.recommendations:
-            tc = type_colors.get(r.type, "white")
-            console.print(f"  [{tc}]#{r.priority} [{r.type.upper()}][/{tc}] {r.title}")
+            tc = _TYPE_COLORS.get(r.type, "white")
+            lines.append(f"  [{tc}]#{r.priority} [{r.type.upper()}][/{tc}] {r.title}")
+        # Una sola llamada: todas las líneas se renderizan en un pase
+        console.print("\n".join(lines))
 
     if verbose and summary.executive_narrative:
         console.print("\n[bold]Executive Narrative[/bold]\n")
@@ -118,7 +170,7 @@ def run_assessment(no_pdf, verbose):
     if not no_pdf:
         console.print("\n[bold]Generating PDF report...[/bold]")
         try:
-            logo = LOGO_PATH if os.path.exists(LOGO_PATH) else None
+            logo = _logo_path()
             if not logo:
                 console.print("  [yellow]⚠  Logo not found at assets/mpiv_logo.png — generating without logo[/yellow]")
             pdf_path = PDFReportGenerator(summary, logo_path=logo).generate()
@@ -130,6 +182,10 @@ def run_assessment(no_pdf, verbose):
 @cli.command("status")
 def check_status():
     """Check configuration and connectivity status."""
+    from rich import box
+    from rich.table import Table
+
+    banner()
     tbl = Table(box=box.ROUNDED, header_style="bold cyan")
     tbl.add_column("Component", style="bold")
     tbl.add_column("Status")
@@ -151,7 +207,7 @@ def check_status():
 
     tbl.add_row("Report Output", "[green]OK[/green]", str(settings.REPORT_OUTPUT_DIR))
 
-    logo_status = "[green]OK[/green]" if os.path.exists(LOGO_PATH) else "[yellow]NOT FOUND[/yellow]"
+    logo_status = "[green]OK[/green]" if _logo_path() else "[yellow]NOT FOUND[/yellow]"
     tbl.add_row("MPIV Logo", logo_status, "assets/mpiv_logo.png")
 
     mode_label = "MOCK (safe)" if settings.MOCK_MODE else "LIVE (real API)"
@@ -164,6 +220,11 @@ def check_status():
 @cli.command("connect")
 def test_connection():
     """Test real Tenable API connection."""
+    import asyncio
+    from rich import box
+    from rich.table import Table
+
+    banner()
     if settings.MOCK_MODE:
         console.print("[yellow]⚠  Currently in MOCK MODE.[/yellow]")
         console.print("Set [bold]MOCK_MODE=false[/bold] in your .env to test real connection.\n")
@@ -179,14 +240,17 @@ def test_connection():
         from integrations.tenable_client import TenableClient
         client = TenableClient()
 
-        with Progress(SpinnerColumn(), TextColumn("{task.description}"),
-                      console=console) as p:
-            task = p.add_task("Fetching scanners...", total=None)
-            scanners = client.get_scanners()
-            p.update(task, description="Fetching assets...")
-            assets = client.get_assets()
-            p.update(task, description="Fetching scans...")
-            scans = client.get_scans()
+        # Las tres llamadas son independientes: se lanzan en paralelo
+        async def _probe():
+            return await asyncio.gather(
+                asyncio.to_thread(client.get_scanners),
+                asyncio.to_thread(client.get_assets),
+                asyncio.to_thread(client.get_scans),
+            )
+
+        with _spinner() as p:
+            task = p.add_task("Probing Tenable API...", total=None)
+            scanners, assets, scans = asyncio.run(_probe())
             p.update(task, description="Done!")
 
         tbl = Table(box=box.ROUNDED, header_style="bold cyan")
@@ -212,6 +276,9 @@ def test_connection():
 @cli.command("mock")
 def toggle_mock():
     """Show how to switch between MOCK and LIVE mode."""
+    from rich.panel import Panel
+
+    banner()
     console.print("\n[bold]Mode Switching Guide[/bold]\n")
     console.print(Panel(
         "[bold]MOCK MODE[/bold] — Safe for demos, no real API calls\n"
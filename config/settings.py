@@ -14,6 +14,8 @@ class Settings:
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o")
     REPORT_OUTPUT_DIR: Path = Path(os.getenv("REPORT_OUTPUT_DIR", "./reports"))
+    CACHE_DIR: Path = Path(os.getenv("CACHE_DIR", "./.cache"))
+    NARRATIVE_CACHE_TTL: int = int(os.getenv("NARRATIVE_CACHE_TTL", str(7 * 86400)))
     CUSTOMER_NAME: str = os.getenv("CUSTOMER_NAME", "Unknown Customer")
     ENGAGEMENT_ID: str = os.getenv("ENGAGEMENT_ID", "ENG-000")
     VERSION: str = "1.0.0"
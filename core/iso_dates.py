@@ -0,0 +1,41 @@
+import sys
+from functools import lru_cache
+from datetime import datetime, timezone
+
+# Python 3.11+ acepta el sufijo "Z" de forma nativa
+_NATIVE_Z = sys.version_info >= (3, 11)
+
+# ciso8601 es opcional (pip install ciso8601): parser en C, bastante más rápido
+try:
+    from ciso8601 import parse_datetime as _ciso_parse
+except ImportError:
+    _ciso_parse = None
+
+
+def parse_iso(iso_str: str) -> datetime:
+    """Parses a Tenable ISO 8601 timestamp, accepting the "Z" suffix."""
+    if _ciso_parse is not None:
+        return _ciso_parse(iso_str)
+    if _NATIVE_Z:
+        return datetime.fromisoformat(iso_str)
+    if iso_str.endswith("Z"):
+        return datetime.fromisoformat(iso_str[:-1]).replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(iso_str)
+
+
+# Memo acotado: timestamps repetidos (exports, mocks) se parsean una vez, pero
+# en un proceso largo con valores casi únicos no crece sin límite
+@lru_cache(maxsize=4096)
+def _epoch_from_str(iso_str: str) -> float | None:
+    try:
+        dt = parse_iso(iso_str)
+    except Exception:
+        return None
+    return dt.timestamp() if dt.tzinfo is not None else None
+
+
+def iso_to_epoch(iso_str) -> float | None:
+    """Epoch seconds for an ISO string, or None if missing/invalid/naive."""
+    if not iso_str or not isinstance(iso_str, str):
+        return None
+    return _epoch_from_str(iso_str)
@@ -1,3 +1,5 @@
+from collections import Counter
+
 from models.assessment import Finding, MaturityLevel, Severity
 
 WEIGHTS = {
@@ -15,9 +17,9 @@ class MaturityEngine:
         self.metrics = metrics
 
     def calculate(self):
-        score = self.BASE
-        for f in self.findings:
-            score += WEIGHTS.get(f.severity, 0)
+        # Conteo por severidad y producto con los pesos: O(k severidades)
+        counts = Counter(f.severity for f in self.findings)
+        score = self.BASE + sum(counts[sev] * w for sev, w in WEIGHTS.items())
         auth_pct = self.metrics.get("authenticated_scans_pct", 0)
         if auth_pct >= 90:
             score += 0.5
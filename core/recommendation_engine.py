@@ -1,3 +1,6 @@
+from collections import defaultdict
+from operator import itemgetter
+
 from models.assessment import Finding, Recommendation, Severity, FindingCategory
 
 PRIORITY = {Severity.CRITICAL: 1, Severity.HIGH: 2,
@@ -18,24 +21,27 @@ class RecommendationEngine:
         self.findings = findings
 
     def generate(self):
-        by_category = {}
+        by_category = defaultdict(list)
         for f in self.findings:
-            by_category.setdefault(f.category, []).append(f)
+            by_category[f.category].append(f)
 
-        recs = []
+        prio = PRIORITY.get
+        ranked = []
         for category, items in by_category.items():
-            items.sort(key=lambda f: PRIORITY.get(f.severity, 5))
-            top = items[0]
+            # Orden completo (estable): findings_refs se publica en este orden
+            items.sort(key=lambda f: prio(f.severity, 5))
+            ranked.append((prio(items[0].severity, 5), category, items))
+
+        # La prioridad final es la posición: se asigna al construir, sin re-sort
+        ranked.sort(key=itemgetter(0))
+        recs = []
+        for i, (_, category, items) in enumerate(ranked, 1):
             lines = [f"• [{f.severity.upper()}] {f.recommendation}" for f in items[:3]]
             recs.append(Recommendation(
-                priority=PRIORITY.get(top.severity, 5),
+                priority=i,
                 title=f"Remediate {category.value} ({len(items)} finding(s))",
                 description="\n".join(lines),
                 findings_refs=[f.id for f in items],
                 type=CATEGORY_TYPE.get(category, "strategic"),
             ))
-
-        recs.sort(key=lambda r: r.priority)
-        for i, r in enumerate(recs, 1):
-            r.priority = i
-        return recs
\ No newline at end of file
+        return recs
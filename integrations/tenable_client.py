@@ -1,22 +1,95 @@
+import hashlib
+import sys
+import time
+from functools import wraps
 from datetime import datetime, timezone
 from loguru import logger
 from config.settings import settings
+from core.iso_dates import iso_to_epoch
 
 
+def _intern(value):
+    """sys.intern for low-cardinality string fields; other values pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
 
-def _days_since(iso_str: str | None) -> int:
+
+def _days_since(iso_str: str | None, now_ts: float | None = None) -> int:
     """Returns days since an ISO datetime string, or 999 if None/invalid."""
     if not iso_str:
         return 999
-    try:
-        dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
-        return (datetime.now(timezone.utc) - dt).days
-    except Exception:
+    if now_ts is None:
+        now_ts = datetime.now(timezone.utc).timestamp()
+    ts = iso_to_epoch(iso_str)
+    if ts is None:
         return 999
+    return int((now_ts - ts) // 86400)
+
+# Constructores de registros normalizados (se aplican con map sobre la API)
+def _mk_scanner(s: dict) -> dict:
+    get = s.get
+    return {
+        "id":           get("id", ""),
+        "name":         get("name", ""),
+        "status":       get("status", "off"),
+        "linked":       get("linked", 1) == 1,
+        "last_connect": get("last_connect"),
+        "scan_count":   get("scan_count", 0),
+    }
+
+
+def _mk_credential(cred: dict) -> dict:
+    get = cred.get
+    return {
+        "id":          get("id", ""),
+        "name":        get("name", ""),
+        "type":        _intern(get("type", "")),
+        "description": get("description", ""),
+    }
+
+
+def _mk_network(net: dict) -> dict:
+    get = net.get
+    return {
+        "id":              get("uuid", ""),
+        "name":            get("name", ""),
+        "description":     get("description", ""),
+        "scanner_count":   get("scanner_count", 0),
+        "asset_count":     get("asset_count", 0),
+        "is_default":      get("is_default", False),
+    }
+
+
+def _ttl_cached(seconds: float):
+    """Caches a no-arg get_* result per client for `seconds` (LIVE mode only)."""
+    def decorator(fn):
+        name = fn.__name__
+
+        @wraps(fn)
+        def wrapper(self):
+            if self.mock:
+                return fn(self)
+            # Copias superficiales: un caller que muta la lista no contamina la cache
+            hit = self._cache.get(name)
+            now = time.monotonic()
+            if hit is not None and now - hit[0] < seconds:
+                return list(hit[1])
+            value = fn(self)
+            self._cache[name] = (now, value)
+            return list(value)
+        return wrapper
+    return decorator
+
 
 class TenableClient:
+    # {hash de (URL, access key): monotonic_ts} de la última verificación; pasado
+    # el TTL se vuelve a consultar /session (claves revocadas o rotadas)
+    _verified: dict[str, float] = {}
+    _VERIFY_TTL = 900
+
     def __init__(self):
         self.mock = settings.MOCK_MODE
+        # {método: (monotonic_ts, resultado)} para endpoints casi estáticos
+        self._cache: dict[str, tuple[float, list]] = {}
 
         if self.mock:
             logger.warning("TenableClient: MOCK MODE active.")
@@ -28,7 +101,44 @@ class TenableClient:
                 access_key=settings.TENABLE_ACCESS_KEY,
                 secret_key=settings.TENABLE_SECRET_KEY,
             )
-            self._verify_connection()
+            self._tune_session()
+            # GET /session solo si la API key no se verificó en los últimos minutos
+            if not self._recently_verified():
+                self.preflight()
+
+    def invalidate(self, name: str | None = None):
+        """Drops the cached result of one get_* method (e.g. 'get_tags'), or all."""
+        if name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(name, None)
+
+    def _tune_session(self):
+        # pyTenable ya reutiliza un requests.Session (keep-alive); solo se
+        # amplía el pool para que los hilos de fetch_all() no abran y
+        # descarten conexiones TLS extra. Los reintentos los gestiona pyTenable.
+        session = getattr(self._tvm, "_session", None)
+        if session is None:
+            return
+        from requests.adapters import HTTPAdapter
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    @staticmethod
+    def _key_id() -> str:
+        raw = f"{settings.TENABLE_API_URL}|{settings.TENABLE_ACCESS_KEY}"
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def _recently_verified(self) -> bool:
+        ts = self._verified.get(self._key_id())
+        return ts is not None and time.monotonic() - ts < self._VERIFY_TTL
+
+    def preflight(self):
+        """Forces a GET /session check and records the key as verified."""
+        self._verified.pop(self._key_id(), None)
+        self._verify_connection()
+        self._verified[self._key_id()] = time.monotonic()
 
     def _verify_connection(self):
         try:
@@ -41,80 +151,84 @@ class TenableClient:
                 "Cannot connect to Tenable. Check your API keys and network."
             )
 
+    # ------------------------------------------------------------------
+    # Colección completa
+    # ------------------------------------------------------------------
+    _FETCHES = ("scanners", "assets", "scans", "policies",
+                "tags", "credentials", "networks")
+
+    def fetch_all(self) -> dict[str, list[dict]]:
+        """Runs every get_* call and returns {name: records}.
+
+        In LIVE mode the seven endpoints are independent HTTPS round trips, so
+        they run on a thread pool and total latency is ~max() instead of sum().
+        """
+        if self.mock:
+            return {name: getattr(self, f"get_{name}")() for name in self._FETCHES}
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=len(self._FETCHES)) as pool:
+            futures = {name: pool.submit(getattr(self, f"get_{name}"))
+                       for name in self._FETCHES}
+            return {name: fut.result() for name, fut in futures.items()}
+
     # ------------------------------------------------------------------
     # Scanners
     # ------------------------------------------------------------------
+    @_ttl_cached(300)
     def get_scanners(self) -> list[dict]:
         if self.mock:
             return self._mock_scanners()
 
-        scanners = []
-        for s in self._tvm.scanners.list():
-            scanners.append({
-                "id":           s.get("id", ""),
-                "name":         s.get("name", ""),
-                "status":       s.get("status", "off"),
-                "linked":       s.get("linked", 1) == 1,
-                "last_connect": s.get("last_connect"),
-                "scan_count":   s.get("scan_count", 0),
-            })
+        scanners = list(map(_mk_scanner, self._tvm.scanners.list()))
         logger.info(f"GET /scanners → {len(scanners)} records")
         return scanners
 
     # ------------------------------------------------------------------
     # Assets — via exports.assets() para datos completos
     # ------------------------------------------------------------------
+    _EXPORT_THREADS = 4
+    # Assets por chunk del export: menos chunks = menos round trips de descarga
+    _EXPORT_CHUNK_SIZE = 5000
+
     def get_assets(self) -> list[dict]:
         if self.mock:
             return self._mock_assets()
 
         logger.info("Fetching assets via exports.assets() (full data)...")
-        all_assets = []
-        for asset in self._tvm.exports.assets(chunk_size=500):
-            # Nombre legible: fqdn > hostname > ipv4 > uuid
-            fqdns     = asset.get("fqdns", []) or []
-            hostnames = asset.get("hostnames", []) or []
-            ipv4s     = asset.get("ipv4s", []) or []
-
-            name = (
-                fqdns[0] if fqdns else
-                hostnames[0] if hostnames else
-                ipv4s[0] if ipv4s else
-                asset.get("id", "unknown")
-            )
-
-            # Source primario
-            sources = asset.get("sources", []) or []
-            source  = sources[0].get("name", "") if sources else ""
-
-            # Tags: lista de dicts {key, value}
-            tags = asset.get("tags", []) or []
-
-            all_assets.append({
-                "id":                          asset.get("id", ""),
-                "name":                        name,
-                "fqdn":                        fqdns[0] if fqdns else "",
-                "hostname":                    hostnames[0] if hostnames else "",
-                "ipv4":                        ipv4s[0] if ipv4s else "",
-                "last_seen":                   asset.get("last_seen", ""),
-                "last_scan_time":              asset.get("last_scan_time", ""),
-                "last_authenticated_scan_date":asset.get("last_authenticated_scan_date"),
-                "has_agent":                   asset.get("has_agent", False),
-                "has_plugin_results":          asset.get("has_plugin_results", False),
-                "source":                      source,
-                "acr_score":                   asset.get("acr_score"),
-                "exposure_score":              asset.get("exposure_score"),
-                "operating_systems":           asset.get("operating_systems", []) or [],
-                "tags":                        tags,
-                "network_name":               asset.get("network_name", "Default"),
-                "azure_resource_id":          asset.get("azure_resource_id"),
-                "aws_ec2_instance_id":        asset.get("aws_ec2_instance_id"),
-            })
-
-        zombie_30  = sum(1 for a in all_assets if _days_since(a.get("last_seen")) > 30)
-        zombie_90  = sum(1 for a in all_assets if _days_since(a.get("last_seen")) > 90)
-        has_agent  = sum(1 for a in all_assets if a.get("has_agent"))
-        auth_asset = sum(1 for a in all_assets if a.get("last_authenticated_scan_date"))
+        # Los chunks del export se descargan en paralelo; cada hilo normaliza
+        # el suyo y al final se concatenan por chunk_id (orden estable).
+        chunks = {}
+
+        def _collect(data, export_uuid, export_type, export_chunk_id):
+            chunks[export_chunk_id] = [self._normalize_asset(a) for a in data]
+
+        futures = self._tvm.exports.assets(
+            chunk_size=self._EXPORT_CHUNK_SIZE).run_threaded(
+                _collect, num_threads=self._EXPORT_THREADS)
+        # run_threaded no propaga errores de los hilos: un chunk fallido
+        # dejaría el inventario incompleto sin aviso
+        for fut in futures:
+            try:
+                fut.result()
+            except Exception as e:
+                logger.error(f"Asset export chunk failed: {e}")
+                raise
+        all_assets = [a for cid in sorted(chunks) for a in chunks[cid]]
+
+        # Estadísticas para el log en una sola pasada
+        now_ts = datetime.now(timezone.utc).timestamp()
+        zombie_30 = zombie_90 = has_agent = auth_asset = 0
+        for a in all_assets:
+            age = _days_since(a["last_seen"], now_ts)
+            if age > 30:
+                zombie_30 += 1
+                if age > 90:
+                    zombie_90 += 1
+            if a["has_agent"]:
+                has_agent += 1
+            if a["last_authenticated_scan_date"]:
+                auth_asset += 1
         logger.info(
             f"Assets fetched: {len(all_assets)} total | "
             f"{has_agent} with agent | {auth_asset} authenticated | "
@@ -122,6 +236,52 @@ class TenableClient:
         )
         return all_assets
 
+    @staticmethod
+    def _normalize_asset(asset: dict) -> dict:
+        get = asset.get
+        # Primer elemento de cada lista una sola vez (las listas vacías → "")
+        fqdns     = get("fqdns", []) or []
+        hostnames = get("hostnames", []) or []
+        ipv4s     = get("ipv4s", []) or []
+        fqdn      = fqdns[0] if fqdns else ""
+        hostname  = hostnames[0] if hostnames else ""
+        ipv4      = ipv4s[0] if ipv4s else ""
+
+        # Nombre legible: fqdn > hostname > ipv4 > uuid
+        name = (
+            fqdn if fqdns else
+            hostname if hostnames else
+            ipv4 if ipv4s else
+            get("id", "unknown")
+        )
+
+        # Source primario (baja cardinalidad: se internan para ahorrar memoria
+        # y acelerar la comparación contra _CLOUD_SOURCES en el analyzer)
+        sources = get("sources", []) or []
+        source  = _intern(sources[0].get("name", "")) if sources else ""
+
+        return {
+            "id":                          get("id", ""),
+            "name":                        name,
+            "fqdn":                        fqdn,
+            "hostname":                    hostname,
+            "ipv4":                        ipv4,
+            "last_seen":                   get("last_seen", ""),
+            "last_scan_time":              get("last_scan_time", ""),
+            "last_authenticated_scan_date":get("last_authenticated_scan_date"),
+            "has_agent":                   get("has_agent", False),
+            "has_plugin_results":          get("has_plugin_results", False),
+            "source":                      source,
+            "acr_score":                   get("acr_score"),
+            "exposure_score":              get("exposure_score"),
+            "operating_systems":           get("operating_systems", []) or [],
+            # Tags: lista de dicts {key, value}
+            "tags":                        get("tags", []) or [],
+            "network_name":               _intern(get("network_name", "Default")),
+            "azure_resource_id":          get("azure_resource_id"),
+            "aws_ec2_instance_id":        get("aws_ec2_instance_id"),
+        }
+
     # ------------------------------------------------------------------
     # Scans
     # ------------------------------------------------------------------
@@ -147,28 +307,34 @@ class TenableClient:
         "fc2fa8b3-028b-83e8-2ebd-4705d0de38bc621fbb0e783517bc": "Web App Scan",
     }
 
+    # wizard_uuid → (has_credentials, credential_level) en una sola tabla.
+    # Se fusiona en orden inverso de prioridad: ALWAYS prevalece.
+    _TEMPLATE_CLASS = {
+        **dict.fromkeys(NEVER_CRED_TEMPLATES,  (False, "none")),
+        **dict.fromkeys(MAYBE_CRED_TEMPLATES,  (True,  "possible")),
+        **dict.fromkeys(ALWAYS_CRED_TEMPLATES, (True,  "guaranteed")),
+    }
+
     def _get_scans_normalized(self) -> list[dict]:
         normalized = []
         ghost_count = 0
         cred_count  = 0
 
+        # Búsquedas de atributos/globales fuera del bucle
+        classify = self._TEMPLATE_CLASS.get
+        from_ts  = datetime.fromtimestamp
+        utc      = timezone.utc
+        append   = normalized.append
+        default  = (True, "agent")
+
         for scan in self._tvm.scans.list():
-            status   = scan.get("status", "")
-            wuuid    = scan.get("wizard_uuid", "") or ""
+            get      = scan.get
+            status   = _intern(get("status", ""))
+            # Pocos templates distintos: internado igual que status/source
+            wuuid    = _intern(get("wizard_uuid", "") or "")
             is_ghost = (status == "empty")
 
-            if wuuid in self.ALWAYS_CRED_TEMPLATES:
-                has_credentials  = True
-                credential_level = "guaranteed"
-            elif wuuid in self.MAYBE_CRED_TEMPLATES:
-                has_credentials  = True
-                credential_level = "possible"
-            elif wuuid in self.NEVER_CRED_TEMPLATES:
-                has_credentials  = False
-                credential_level = "none"
-            else:
-                has_credentials  = True
-                credential_level = "agent"
+            has_credentials, credential_level = classify(wuuid, default)
 
             if is_ghost:
                 ghost_count += 1
@@ -177,22 +343,22 @@ class TenableClient:
             if has_credentials:
                 cred_count += 1
 
-            last_run = scan.get("last_modification_date") or scan.get("starttime")
+            last_run = get("last_modification_date") or get("starttime")
             if isinstance(last_run, (int, float)) and last_run > 0:
-                last_run = datetime.fromtimestamp(last_run, tz=timezone.utc).isoformat()
+                last_run = from_ts(last_run, tz=utc).isoformat()
 
-            normalized.append({
-                "id":                 scan.get("id", ""),
-                "name":               scan.get("name", ""),
+            append({
+                "id":                 get("id", ""),
+                "name":               get("name", ""),
                 "credential_enabled": has_credentials,
                 "credential_level":   credential_level,
                 "is_ghost":           is_ghost,
                 "wizard_uuid":        wuuid,
                 "last_run":           last_run,
-                "asset_count":        scan.get("total", 0),
+                "asset_count":        get("total", 0),
                 "status":             status,
-                "enabled":            scan.get("enabled", False),
-                "has_schedule":       bool(scan.get("rrules")),
+                "enabled":            get("enabled", False),
+                "has_schedule":       bool(get("rrules")),
             })
 
         active = len(normalized) - ghost_count
@@ -206,6 +372,7 @@ class TenableClient:
     # ------------------------------------------------------------------
     # Policies
     # ------------------------------------------------------------------
+    @_ttl_cached(300)
     def get_policies(self) -> list[dict]:
         if self.mock:
             return self._mock_policies()
@@ -217,6 +384,7 @@ class TenableClient:
     # ------------------------------------------------------------------
     # Tags
     # ------------------------------------------------------------------
+    @_ttl_cached(300)
     def get_tags(self) -> list[dict]:
         if self.mock:
             return self._mock_tags()
@@ -228,38 +396,24 @@ class TenableClient:
     # ------------------------------------------------------------------
     # ✅ NUEVO — Credentials
     # ------------------------------------------------------------------
+    @_ttl_cached(300)
     def get_credentials(self) -> list[dict]:
         if self.mock:
             return self._mock_credentials()
 
-        credentials = []
-        for cred in self._tvm.credentials.list():
-            credentials.append({
-                "id":          cred.get("id", ""),
-                "name":        cred.get("name", ""),
-                "type":        cred.get("type", ""),
-                "description": cred.get("description", ""),
-            })
+        credentials = list(map(_mk_credential, self._tvm.credentials.list()))
         logger.info(f"GET /credentials → {len(credentials)} records")
         return credentials
 
     # ------------------------------------------------------------------
     # ✅ NUEVO — Networks
     # ------------------------------------------------------------------
+    @_ttl_cached(300)
     def get_networks(self) -> list[dict]:
         if self.mock:
             return self._mock_networks()
 
-        networks = []
-        for net in self._tvm.networks.list():
-            networks.append({
-                "id":              net.get("uuid", ""),
-                "name":            net.get("name", ""),
-                "description":     net.get("description", ""),
-                "scanner_count":   net.get("scanner_count", 0),
-                "asset_count":     net.get("asset_count", 0),
-                "is_default":      net.get("is_default", False),
-            })
+        networks = list(map(_mk_network, self._tvm.networks.list()))
         logger.info(f"GET /networks → {len(networks)} records")
         return networks
 
@@ -267,58 +421,75 @@ class TenableClient:
     # MOCK DATA
     # ==================================================================
     def _mock_scanners(self):
-        return [
-            {"id": "s-001", "name": "HQ-Scanner-01",      "status": "on",  "linked": True,  "last_connect": "2024-05-01T10:00:00Z", "scan_count": 45},
-            {"id": "s-002", "name": "DMZ-Scanner-01",     "status": "off", "linked": True,  "last_connect": "2024-03-10T08:00:00Z", "scan_count": 0},
-            {"id": "s-003", "name": "Cloud-Scanner-AWS",  "status": "on",  "linked": True,  "last_connect": "2024-05-15T12:00:00Z", "scan_count": 120},
-            {"id": "s-004", "name": "Branch-Scanner-MTY", "status": "on",  "linked": False, "last_connect": None,                  "scan_count": 0},
-        ]
+        return list(_MOCK_SCANNERS)
 
     def _mock_assets(self):
-        return [
-            {
-                "id":        f"a-{i:04d}",
-                "fqdn":      f"host-{i}.corp.local",
-                "hostname":  f"host-{i}",
-                "ipv4":      f"10.0.{i//256}.{i%256}",
-                "last_seen": "2024-05-15T00:00:00Z" if i % 5 != 0 else "2024-01-01T00:00:00Z",
-                "tags":      [{"key": "env", "value": "production"}] if i % 2 == 0 else [],
-            }
-            for i in range(1, 251)
-        ]
+        return list(_MOCK_ASSETS)
 
     def _mock_scans(self):
-        return [
-            {"id": "sc-001", "name": "Weekly Full Scan - HQ",    "credential_enabled": True,  "last_run": "2024-05-14T02:00:00Z", "asset_count": 180},
-            {"id": "sc-002", "name": "DMZ Discovery Scan",       "credential_enabled": False, "last_run": "2024-02-01T10:00:00Z", "asset_count": 30},
-            {"id": "sc-003", "name": "Cloud Assets Scan",        "credential_enabled": True,  "last_run": "2024-05-15T03:00:00Z", "asset_count": 65},
-            {"id": "sc-004", "name": "AD Servers - Credentialed","credential_enabled": True,  "last_run": "2024-05-13T01:00:00Z", "asset_count": 12},
-        ]
+        return list(_MOCK_SCANS)
 
     def _mock_policies(self):
-        return [
-            {"id": "p-001", "name": "Basic Network Scan",        "template": "basic"},
-            {"id": "p-002", "name": "Discovery Only",            "template": "discovery"},
-            {"id": "p-003", "name": "Credentialed Patch Audit",  "template": "credentialed_patch_audit"},
-        ]
+        return list(_MOCK_POLICIES)
 
     def _mock_tags(self):
-        return [
-            {"id": "t-001", "key": "env",   "value": "production"},
-            {"id": "t-002", "key": "env",   "value": "development"},
-            {"id": "t-003", "key": "owner", "value": "IT-Ops"},
-        ]
+        return list(_MOCK_TAGS)
 
     def _mock_credentials(self):
-        return [
-            {"id": "cr-001", "name": "Windows Domain Admin", "type": "Windows",  "description": "Domain admin for HQ servers"},
-            {"id": "cr-002", "name": "Linux SSH Key",         "type": "SSH",      "description": "SSH key for Linux fleet"},
-            {"id": "cr-003", "name": "DB Read-Only",          "type": "Database", "description": "Read-only DB credentials"},
-        ]
+        return list(_MOCK_CREDENTIALS)
 
     def _mock_networks(self):
-        return [
-            {"id": "net-001", "name": "Default",     "description": "Default network", "scanner_count": 2, "asset_count": 180, "is_default": True},
-            {"id": "net-002", "name": "DMZ",         "description": "DMZ segment",     "scanner_count": 1, "asset_count": 30,  "is_default": False},
-            {"id": "net-003", "name": "Cloud-AWS",   "description": "AWS network",     "scanner_count": 1, "asset_count": 65,  "is_default": False},
-        ]
\ No newline at end of file
+        return list(_MOCK_NETWORKS)
+
+
+# Datos MOCK construidos una sola vez al importar; los _mock_* devuelven
+# una copia superficial de la lista.
+_MOCK_SCANNERS = (
+    {"id": "s-001", "name": "HQ-Scanner-01",      "status": "on",  "linked": True,  "last_connect": "2024-05-01T10:00:00Z", "scan_count": 45},
+    {"id": "s-002", "name": "DMZ-Scanner-01",     "status": "off", "linked": True,  "last_connect": "2024-03-10T08:00:00Z", "scan_count": 0},
+    {"id": "s-003", "name": "Cloud-Scanner-AWS",  "status": "on",  "linked": True,  "last_connect": "2024-05-15T12:00:00Z", "scan_count": 120},
+    {"id": "s-004", "name": "Branch-Scanner-MTY", "status": "on",  "linked": False, "last_connect": None,                  "scan_count": 0},
+)
+
+_MOCK_ASSETS = tuple(
+    {
+        "id":        f"a-{i:04d}",
+        "fqdn":      f"host-{i}.corp.local",
+        "hostname":  f"host-{i}",
+        "ipv4":      f"10.0.{i//256}.{i%256}",
+        "last_seen": "2024-05-15T00:00:00Z" if i % 5 != 0 else "2024-01-01T00:00:00Z",
+        "tags":      [{"key": "env", "value": "production"}] if i % 2 == 0 else [],
+    }
+    for i in range(1, 251)
+)
+
+_MOCK_SCANS = (
+    {"id": "sc-001", "name": "Weekly Full Scan - HQ",    "credential_enabled": True,  "last_run": "2024-05-14T02:00:00Z", "asset_count": 180},
+    {"id": "sc-002", "name": "DMZ Discovery Scan",       "credential_enabled": False, "last_run": "2024-02-01T10:00:00Z", "asset_count": 30},
+    {"id": "sc-003", "name": "Cloud Assets Scan",        "credential_enabled": True,  "last_run": "2024-05-15T03:00:00Z", "asset_count": 65},
+    {"id": "sc-004", "name": "AD Servers - Credentialed","credential_enabled": True,  "last_run": "2024-05-13T01:00:00Z", "asset_count": 12},
+)
+
+_MOCK_POLICIES = (
+    {"id": "p-001", "name": "Basic Network Scan",        "template": "basic"},
+    {"id": "p-002", "name": "Discovery Only",            "template": "discovery"},
+    {"id": "p-003", "name": "Credentialed Patch Audit",  "template": "credentialed_patch_audit"},
+)
+
+_MOCK_TAGS = (
+    {"id": "t-001", "key": "env",   "value": "production"},
+    {"id": "t-002", "key": "env",   "value": "development"},
+    {"id": "t-003", "key": "owner", "value": "IT-Ops"},
+)
+
+_MOCK_CREDENTIALS = (
+    {"id": "cr-001", "name": "Windows Domain Admin", "type": "Windows",  "description": "Domain admin for HQ servers"},
+    {"id": "cr-002", "name": "Linux SSH Key",         "type": "SSH",      "description": "SSH key for Linux fleet"},
+    {"id": "cr-003", "name": "DB Read-Only",          "type": "Database", "description": "Read-only DB credentials"},
+)
+
+_MOCK_NETWORKS = (
+    {"id": "net-001", "name": "Default",     "description": "Default network", "scanner_count": 2, "asset_count": 180, "is_default": True},
+    {"id": "net-002", "name": "DMZ",         "description": "DMZ segment",     "scanner_count": 1, "asset_count": 30,  "is_default": False},
+    {"id": "net-003", "name": "Cloud-AWS",   "description": "AWS network",     "scanner_count": 1, "asset_count": 65,  "is_default": False},
+)
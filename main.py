@@ -5,9 +5,10 @@ from config.settings import settings
 logger.remove()
 logger.add(sys.stderr, level=settings.LOG_LEVEL,
            format="<green>{time:HH:mm:ss}</green> | <level>{level:<8}</level> | {message}",
-           colorize=True)
+           colorize=sys.stderr.isatty())
+# enqueue: la escritura a disco ocurre en un hilo aparte y no bloquea la colecta
 logger.add("logs/advisor.log", level="DEBUG", rotation="10 MB",
-           format="{time} | {level} | {message}")
+           format="{time} | {level} | {message}", enqueue=True)
 
 from cli.commands import cli
 
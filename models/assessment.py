@@ -1,3 +1,4 @@
+from collections import Counter
 from datetime import datetime
 from enum import Enum
 from typing import Optional
@@ -55,6 +56,10 @@ class AssessmentSummary(BaseModel):
     recommendations: list[Recommendation] = Field(default_factory=list)
     executive_narrative: Optional[str] = None
 
+    @property
+    def severity_counts(self) -> Counter:
+        return Counter(f.severity for f in self.findings)
+
     @property
     def critical_findings(self):
         return [f for f in self.findings if f.severity == Severity.CRITICAL]
@@ -1,16 +1,20 @@
 import os
+from typing import Optional
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import cm
+from reportlab.lib.utils import ImageReader
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, HRFlowable, Image, KeepTogether
+    PageBreak, HRFlowable, Flowable, KeepTogether
 )
+from models.assessment import Severity
 
 MPIV_NAVY  = colors.HexColor("#1B3A6B")
 MPIV_BLUE  = colors.HexColor("#2E5FA3")
@@ -19,33 +23,95 @@ MPIV_GRAY  = colors.HexColor("#F4F6F9")
 MPIV_DARK  = colors.HexColor("#1A1A2E")
 MPIV_WHITE = colors.white
 MPIV_ACCENT= colors.HexColor("#4A90D9")
-SEV_CRITICAL = colors.HexColor("#C62828")
-SEV_HIGH     = colors.HexColor("#EF6C00")
-SEV_MEDIUM   = colors.HexColor("#F9A825")
-SEV_LOW      = colors.HexColor("#2E7D32")
+# Hex por severidad para markup de Paragraph; los Color salen del mismo dict
+SEV_HEX = {"critical": "#C62828", "high": "#EF6C00",
+           "medium": "#F9A825", "low": "#2E7D32"}
+SEV_CRITICAL = colors.HexColor(SEV_HEX["critical"])
+SEV_HIGH     = colors.HexColor(SEV_HEX["high"])
+SEV_MEDIUM   = colors.HexColor(SEV_HEX["medium"])
+SEV_LOW      = colors.HexColor(SEV_HEX["low"])
 
 PAGE_W, PAGE_H = A4
 MARGIN = 2 * cm
+# Anchos de columna fijos del layout (tuplas: Table las copia si las ajusta)
+CONTENT_W  = PAGE_W - 2*MARGIN
+KPI_COLS   = (CONTENT_W / 5,) * 5
+GAUGE_COLS = KPI_COLS
+SEV_COLS   = (CONTENT_W / 4,) * 4
+PHASE_COLS = (CONTENT_W / 3,) * 3
+HALF_COLS  = (CONTENT_W / 2,) * 2
+
+SEV_ORDER  = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+# Rango por miembro del enum (INFO al final): clave de sort sin lambda ni .value
+_SEV_RANK  = {sev: SEV_ORDER.get(sev.value, 9) for sev in Severity}
+SEV_COLORS = {"critical": SEV_CRITICAL, "high": SEV_HIGH,
+              "medium": SEV_MEDIUM, "low": SEV_LOW}
+# Etiqueta y color por severidad, resueltos una vez por miembro del enum
+_SEV_LABEL = {sev: (sev.value.upper(), SEV_COLORS.get(sev.value, MPIV_DARK))
+              for sev in Severity}
+
+
+@lru_cache(maxsize=256)
+def _description_lines(description):
+    """Non-empty lines of a recommendation description (cached by text)."""
+    if "\n" not in description:
+        stripped = description.strip()
+        return (stripped,) if stripped else ()
+    return tuple(line.strip() for line in description.split("\n") if line.strip())
+
+
+def _sev_rank(finding):
+    return _SEV_RANK[finding.severity]
+
+
+def _score_hex(score):
+    """Hex colour for the maturity score (same thresholds as the CLI)."""
+    return SEV_HEX["low"] if score >= 3.5 else SEV_HEX["medium"] if score >= 2.5 else SEV_HEX["critical"]
+
+
+class _LogoFlowable(Flowable):
+    """Draws an already-open ImageReader (the one the page header uses)."""
+
+    def __init__(self, reader, width, height):
+        super().__init__()
+        self.reader = reader
+        self.width, self.height = width, height
+        self.hAlign = "CENTER"
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        self.canv.drawImage(self.reader, 0, 0, self.width, self.height, mask="auto")
 
 
 class MPIVDocTemplate(SimpleDocTemplate):
-    def __init__(self, filename, logo_path, customer_name, engagement_id, **kwargs):
+    def __init__(self, filename, logo_path, customer_name, engagement_id,
+                 logo_image=None, **kwargs):
         super().__init__(filename, **kwargs)
         self.logo_path = logo_path
+        # ImageReader ya decodificado (compartido con la portada), o el path
+        self.logo_image = logo_image or logo_path
+        # El logo no cambia durante el build: un solo stat
+        self._logo_ok = bool(logo_path) and os.path.exists(logo_path)
         self.customer_name = customer_name
         self.engagement_id = engagement_id
 
-    def afterPage(self):
-        c = self.canv
-        page_num = self.page
+    def beforeDocument(self):
+        # Formularios (XObject) ya definidos en el canvas de este build
+        self._forms = set()
+
+    def _chrome(self, c, name, inner):
+        """Page bars, fixed text and logo, recorded once as a form XObject."""
+        c.beginForm(name)
         # Top bar
         c.setFillColor(MPIV_NAVY)
         c.rect(0, PAGE_H - 1.1*cm, PAGE_W, 1.1*cm, fill=1, stroke=0)
-        if page_num > 1 and self.logo_path and os.path.exists(self.logo_path):
-            c.drawImage(self.logo_path, MARGIN, PAGE_H - 1.0*cm,
+        if inner and self._logo_ok:
+            c.drawImage(self.logo_image, MARGIN, PAGE_H - 1.0*cm,
                         width=2.4*cm, height=0.8*cm,
                         preserveAspectRatio=True, mask='auto')
-        if page_num > 1:
+        if inner:
             c.setFillColor(MPIV_WHITE)
             c.setFont("Helvetica", 7.5)
             c.drawRightString(PAGE_W - MARGIN, PAGE_H - 0.65*cm,
@@ -56,10 +122,24 @@ class MPIVDocTemplate(SimpleDocTemplate):
         c.setFillColor(MPIV_WHITE)
         c.setFont("Helvetica", 7)
         c.drawString(MARGIN, 0.3*cm, f"MPIV Partners  |  {self.engagement_id}")
-        c.drawRightString(PAGE_W - MARGIN, 0.3*cm, f"Page {page_num}")
         c.setStrokeColor(MPIV_ACCENT)
         c.setLineWidth(1.5)
         c.line(0, PAGE_H - 1.1*cm, PAGE_W, PAGE_H - 1.1*cm)
+        c.endForm()
+        self._forms.add(name)
+
+    def afterPage(self):
+        c = self.canv
+        page_num = self.page
+        # Portada e interiores comparten un XObject cada uno; solo el número
+        # de página se dibuja en cada hoja
+        name = "mpiv_chrome" if page_num > 1 else "mpiv_chrome_cover"
+        if name not in self._forms:
+            self._chrome(c, name, page_num > 1)
+        c.doForm(name)
+        c.setFillColor(MPIV_WHITE)
+        c.setFont("Helvetica", 7)
+        c.drawRightString(PAGE_W - MARGIN, 0.3*cm, f"Page {page_num}")
 
 
 def _S(name, **kw):
@@ -89,6 +169,8 @@ STYLES = {
         textColor=MPIV_WHITE, alignment=TA_CENTER),
     "table_cell": _S("tc", fontName="Helvetica", fontSize=8.5,
         textColor=MPIV_DARK, leading=12),
+    "table_cell_center": _S("tcc", fontName="Helvetica", fontSize=8.5,
+        textColor=MPIV_DARK, leading=12, alignment=TA_CENTER),
     "finding_title": _S("ft", fontName="Helvetica-Bold", fontSize=9,
         textColor=MPIV_NAVY, leading=12),
     "roadmap_item": _S("ri", fontName="Helvetica", fontSize=8.5,
@@ -97,9 +179,109 @@ STYLES = {
         textColor=MPIV_DARK, leading=16, spaceAfter=4),
     "footer_note": _S("fn", fontName="Helvetica-Oblique", fontSize=8,
         textColor=colors.HexColor("#888888"), alignment=TA_CENTER),
+    # Estilos de gauge, badge y roadmap (antes se creaban en cada llamada/loop)
+    "gauge": _S("g", fontName="Helvetica", fontSize=8,
+        textColor=MPIV_WHITE, alignment=TA_CENTER, leading=12),
+    "gauge_current": _S("g", fontName="Helvetica-Bold", fontSize=9,
+        textColor=MPIV_WHITE, alignment=TA_CENTER, leading=12),
+    "sev_badge": _S("sev", fontName="Helvetica-Bold", fontSize=8,
+        textColor=MPIV_WHITE, alignment=TA_CENTER),
+    "phase_header": _S("ph", fontName="Helvetica-Bold", fontSize=11,
+        textColor=MPIV_WHITE, alignment=TA_CENTER, leading=16),
+    "roadmap_sub": _S("ri2", fontName="Helvetica", fontSize=7.5,
+        textColor=colors.HexColor("#555555"), leading=11, leftIndent=8),
 }
 
 
+# Tramos del gauge de madurez: (rango, nivel, color de fondo)
+_MATURITY_LEVELS = (
+    ("1.0-1.9", "Initial",    colors.HexColor("#C62828")),
+    ("2.0-2.9", "Developing", colors.HexColor("#EF6C00")),
+    ("3.0-3.9", "Defined",    colors.HexColor("#F9A825")),
+    ("4.0-4.9", "Managed",    colors.HexColor("#388E3C")),
+    ("5.0",     "Optimized",  colors.HexColor("#1565C0")),
+)
+# Fases del roadmap y columna de cada tipo de recomendación (resto → 90 días)
+_PHASES = (
+    ("30 Days", "Quick Wins", MPIV_NAVY,  "quick-win"),
+    ("60 Days", "Strategic",  MPIV_BLUE,  "strategic"),
+    ("90 Days", "Roadmap",    MPIV_ACCENT,"roadmap"),
+)
+_PHASE_INDEX = {"quick-win": 0, "strategic": 1, "roadmap": 2}
+
+# Estilos de tabla estáticos: se construyen una vez al importar
+_TOC_STYLE = TableStyle([
+    ("FONTNAME",      (0,0),(-1,-1), "Helvetica"),
+    ("FONTSIZE",      (0,0),(-1,-1), 9.5),
+    ("TEXTCOLOR",     (0,0),(-1,-1), MPIV_DARK),
+    ("TOPPADDING",    (0,0),(-1,-1), 5),
+    ("BOTTOMPADDING", (0,0),(-1,-1), 5),
+    ("LINEBELOW",     (0,0),(-1,-1), 0.3, colors.HexColor("#CCCCCC")),
+])
+_METRICS_STYLE = TableStyle([
+    ("FONTNAME",      (0,0),(-1,-1), "Helvetica"),
+    ("FONTSIZE",      (0,0),(-1,-1), 8.5),
+    ("TEXTCOLOR",     (0,0),(-1,-1), MPIV_DARK),
+    ("BACKGROUND",    (0,0),(-1,0), MPIV_NAVY),
+    ("TEXTCOLOR",     (0,0),(-1,0), MPIV_WHITE),
+    ("FONTNAME",      (0,0),(-1,0), "Helvetica-Bold"),
+    ("ALIGN",         (0,0),(0,0), "CENTER"),
+    ("ROWBACKGROUNDS",(0,1),(-1,-1), [MPIV_WHITE, MPIV_GRAY]),
+    ("GRID",          (0,0),(-1,-1), 0.3, colors.HexColor("#C8D8F0")),
+    ("ALIGN",         (1,0),(-1,-1), "CENTER"),
+    ("VALIGN",        (0,0),(-1,-1), "MIDDLE"),
+    ("TOPPADDING",    (0,0),(-1,-1), 7),
+    ("BOTTOMPADDING", (0,0),(-1,-1), 7),
+    ("LEFTPADDING",   (0,0),(-1,-1), 8),
+])
+_NEXT_STEPS_STYLE = TableStyle([
+    ("BACKGROUND",    (0,0),(0,-1), MPIV_NAVY),
+    ("TEXTCOLOR",     (0,0),(0,-1), MPIV_WHITE),
+    ("FONTNAME",      (0,0),(0,-1), "Helvetica-Bold"),
+    ("FONTSIZE",      (0,0),(0,-1), 9),
+    ("ALIGN",         (0,0),(0,-1), "CENTER"),
+    ("VALIGN",        (0,0),(-1,-1), "MIDDLE"),
+    ("TOPPADDING",    (0,0),(-1,-1), 6),
+    ("BOTTOMPADDING", (0,0),(-1,-1), 6),
+    ("LEFTPADDING",   (0,0),(-1,-1), 6),
+    ("LINEBELOW",     (0,0),(-1,-1), 0.3, colors.HexColor("#CCCCCC")),
+])
+# Tarjeta de detalle de un finding; el color del badge se agrega por tarjeta
+_CARD_COLS = (CONTENT_W - 2.5*cm, 2.5*cm)
+_CARD_BASE_STYLE = (
+    ("BACKGROUND",   (0,0),(-1,0), MPIV_LIGHT),
+    ("SPAN",         (0,1),(1,1)),
+    ("SPAN",         (0,2),(1,2)),
+    ("SPAN",         (0,3),(1,3)),
+    ("SPAN",         (0,4),(1,4)),
+    ("BOX",          (0,0),(-1,-1), 0.8, colors.HexColor("#C8D8F0")),
+    ("LINEBELOW",    (0,0),(-1,0), 0.5, colors.HexColor("#C8D8F0")),
+    ("TOPPADDING",   (0,0),(-1,-1), 6),
+    ("BOTTOMPADDING",(0,0),(-1,-1), 6),
+    ("LEFTPADDING",  (0,0),(-1,-1), 8),
+    ("VALIGN",       (0,0),(-1,-1), "MIDDLE"),
+)
+# Parte fija de la tabla resumen de findings; el color por severidad se agrega por fila
+_FINDINGS_BASE_STYLE = (
+    ("FONTNAME",      (0,0),(-1,-1), "Helvetica"),
+    ("FONTSIZE",      (0,0),(-1,-1), 8.5),
+    ("TEXTCOLOR",     (0,0),(-1,-1), MPIV_DARK),
+    ("BACKGROUND",    (0,0),(-1,0), MPIV_NAVY),
+    ("TEXTCOLOR",     (0,0),(-1,0), MPIV_WHITE),
+    ("FONTNAME",      (0,0),(-1,0), "Helvetica-Bold"),
+    ("ALIGN",         (0,0),(-1,0), "CENTER"),
+    ("ROWBACKGROUNDS",(0,1),(-1,-1), [MPIV_WHITE, MPIV_GRAY]),
+    ("GRID",          (0,0),(-1,-1), 0.3, colors.HexColor("#C8D8F0")),
+    ("ALIGN",         (0,0),(1,-1), "CENTER"),
+    ("ALIGN",         (4,0),(4,-1), "CENTER"),
+    ("FONTNAME",      (1,1),(1,-1), "Helvetica-Bold"),
+    ("VALIGN",        (0,0),(-1,-1), "MIDDLE"),
+    ("TOPPADDING",    (0,0),(-1,-1), 6),
+    ("BOTTOMPADDING", (0,0),(-1,-1), 6),
+    ("LEFTPADDING",   (0,0),(-1,-1), 6),
+)
+
+
 def _divider():
     return HRFlowable(width="100%", thickness=1.5, color=MPIV_NAVY,
                       spaceAfter=8, spaceBefore=4)
@@ -109,6 +291,9 @@ class PDFReportGenerator:
     def __init__(self, summary, logo_path=None):
         self.summary = summary
         self.logo_path = logo_path
+        self._logo_ok = bool(logo_path) and os.path.exists(logo_path)
+        # Un solo ImageReader para portada y cabecera: el PNG se decodifica una vez
+        self._logo_reader = ImageReader(logo_path) if self._logo_ok else None
         try:
             from config.settings import settings
             self.output_dir = Path(settings.REPORT_OUTPUT_DIR)
@@ -116,19 +301,27 @@ class PDFReportGenerator:
             self.output_dir = Path("./reports")
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def generate(self) -> str:
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        path = str(self.output_dir /
-                   f"MPIV_HealthCheck_{self.summary.engagement_id}_{ts}.pdf")
+    def generate(self, stream=None) -> Optional[str]:
+        """Builds the PDF and returns its path, or None when written to `stream`."""
+        # stream: file-like binario opcional; si se pasa, el PDF se escribe ahí
+        if stream is not None:
+            path = None
+        else:
+            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = str(self.output_dir /
+                       f"MPIV_HealthCheck_{self.summary.engagement_id}_{ts}.pdf")
         doc = MPIVDocTemplate(
-            path,
+            path if stream is None else stream,
             logo_path=self.logo_path,
+            logo_image=self._logo_reader,
             customer_name=self.summary.customer_name,
             engagement_id=self.summary.engagement_id,
             pagesize=A4,
             leftMargin=MARGIN, rightMargin=MARGIN,
             topMargin=1.5*cm, bottomMargin=1.5*cm,
         )
+        # Conteo por severidad de este render, compartido por todas las secciones
+        self._sev_counts = self.summary.severity_counts
         story = []
         story += self._cover()
         story.append(PageBreak())
@@ -143,6 +336,8 @@ class PDFReportGenerator:
         story.append(PageBreak())
         story += self._next_steps()
         doc.build(story)
+        if path is None:
+            return None
         try:
             from loguru import logger
             logger.info(f"PDF generated: {path}")
@@ -154,13 +349,11 @@ class PDFReportGenerator:
     def _cover(self):
         els = []
         logo_cell = ""
-        if self.logo_path and os.path.exists(self.logo_path):
-            img = Image(self.logo_path, width=4*cm, height=4*cm)
-            img.hAlign = "CENTER"
-            logo_cell = img
+        if self._logo_ok:
+            logo_cell = _LogoFlowable(self._logo_reader, 4*cm, 4*cm)
 
         top = Table([[logo_cell or Paragraph("MPIV PARTNERS", STYLES["cover_company"])]],
-                    colWidths=[PAGE_W - 2*MARGIN])
+                    colWidths=(CONTENT_W,))
         top.setStyle(TableStyle([
             ("BACKGROUND",    (0,0),(-1,-1), MPIV_NAVY),
             ("ALIGN",         (0,0),(-1,-1), "CENTER"),
@@ -173,7 +366,7 @@ class PDFReportGenerator:
            [Paragraph("TENABLE VULNERABILITY MANAGEMENT", STYLES["cover_company"])],
            [Paragraph("Health Check", STYLES["cover_title"])],
            [Paragraph(self.summary.customer_name, STYLES["cover_sub"])],
-        ], colWidths=[PAGE_W - 2*MARGIN])
+        ], colWidths=(CONTENT_W,))
         title_band.setStyle(TableStyle([
             ("BACKGROUND",    (0,0),(-1,-1), MPIV_BLUE),
             ("ALIGN",         (0,0),(-1,-1), "CENTER"),
@@ -184,8 +377,7 @@ class PDFReportGenerator:
         els.append(Spacer(1, 0.8*cm))
 
         s = self.summary
-        score_color = ("#2E7D32" if s.maturity_score >= 3.5
-                       else "#F9A825" if s.maturity_score >= 2.5 else "#C62828")
+        score_color = _score_hex(s.maturity_score)
         meta_rows = [
             ["Engagement ID",   s.engagement_id],
             ["Assessment Date", s.assessment_date.strftime("%B %d, %Y")],
@@ -196,7 +388,7 @@ class PDFReportGenerator:
         ]
         meta_data = [[Paragraph(r[0], STYLES["cover_meta_label"]),
                       Paragraph(r[1], STYLES["cover_meta_value"])] for r in meta_rows]
-        meta_t = Table(meta_data, colWidths=[5*cm, PAGE_W - 2*MARGIN - 5*cm])
+        meta_t = Table(meta_data, colWidths=(5*cm, CONTENT_W - 5*cm))
         meta_t.setStyle(TableStyle([
             ("ROWBACKGROUNDS",(0,0),(-1,-1), [MPIV_WHITE, MPIV_LIGHT]),
             ("GRID",          (0,0),(-1,-1), 0.3, colors.HexColor("#C8D8F0")),
@@ -207,14 +399,13 @@ class PDFReportGenerator:
         els.append(meta_t)
         els.append(Spacer(1, 0.8*cm))
 
-        kpi_w = (PAGE_W - 2*MARGIN) / 5
         kpi = Table([[
             Paragraph(f"<b>{s.total_assets}</b><br/>Total Assets", STYLES["body_center"]),
             Paragraph(f"<b>{s.authenticated_scans_pct:.0f}%</b><br/>Auth. Coverage", STYLES["body_center"]),
             Paragraph(f"<b>{s.scanner_health_pct:.0f}%</b><br/>Scanner Health", STYLES["body_center"]),
-            Paragraph(f'<b><font color="#C62828">{len(s.critical_findings)}</font></b><br/>Critical', STYLES["body_center"]),
+            Paragraph(f'<b><font color="{SEV_HEX["critical"]}">{self._sev_counts[Severity.CRITICAL]}</font></b><br/>Critical', STYLES["body_center"]),
             Paragraph(f"<b>{len(s.findings)}</b><br/>Total Findings", STYLES["body_center"]),
-        ]], colWidths=[kpi_w]*5)
+        ]], colWidths=KPI_COLS)
         kpi.setStyle(TableStyle([
             ("BACKGROUND",    (0,0),(-1,-1), MPIV_NAVY),
             ("TEXTCOLOR",     (0,0),(-1,-1), MPIV_WHITE),
@@ -236,93 +427,83 @@ class PDFReportGenerator:
         els = [Spacer(1, 1.5*cm)]
         els.append(Paragraph("Table of Contents", STYLES["section_title"]))
         els.append(_divider())
-        for num, title in [
-            ("1.", "Executive Summary"),
-            ("2.", "Maturity Assessment"),
-            ("3.", "Detailed Findings"),
-            ("4.", "Remediation Roadmap (30-60-90 Days)"),
-            ("5.", "Next Steps & Document Acceptance"),
-        ]:
-            row = Table([[Paragraph(num, STYLES["body"]),
-                          Paragraph(title, STYLES["body"])]],
-                        colWidths=[1.2*cm, PAGE_W - 2*MARGIN - 1.2*cm])
-            row.setStyle(TableStyle([
-                ("TOPPADDING",    (0,0),(-1,-1), 5),
-                ("BOTTOMPADDING", (0,0),(-1,-1), 5),
-                ("LINEBELOW",     (0,0),(-1,-1), 0.3, colors.HexColor("#CCCCCC")),
-            ]))
-            els.append(row)
+        # Una sola Table para todas las entradas (un flowable, un wrap)
+        toc = Table([
+            ["1.", "Executive Summary"],
+            ["2.", "Maturity Assessment"],
+            ["3.", "Detailed Findings"],
+            ["4.", "Remediation Roadmap (30-60-90 Days)"],
+            ["5.", "Next Steps & Document Acceptance"],
+        ], colWidths=(1.2*cm, CONTENT_W - 1.2*cm))
+        toc.setStyle(_TOC_STYLE)
+        els.append(toc)
         return els
 
     # ── EXECUTIVE SUMMARY ─────────────────────────────────────────────────────
     def _exec_summary(self):
         els = [Paragraph("1. Executive Summary", STYLES["section_title"]), _divider()]
-        narrative = self.summary.executive_narrative or self._default_narrative()
-        for para in narrative.split("\n\n"):
-            if para.strip():
-                els.append(Paragraph(para.strip(), STYLES["body"]))
+        for para in self._narrative_paragraphs():
+            els.append(Paragraph(para, STYLES["body"]))
         return els
 
+    def _narrative_paragraphs(self):
+        """Executive summary paragraphs: the AI narrative if present, else the default text."""
+        narrative = self.summary.executive_narrative
+        if not narrative:
+            return self._default_narrative()
+        return [p.strip() for p in narrative.split("\n\n") if p.strip()]
+
     def _default_narrative(self):
         s = self.summary
-        return (
+        counts = self._sev_counts
+        return [
             f"MPIV Partners conducted a Tenable Vulnerability Management Health Check "
             f"for {s.customer_name} on {s.assessment_date.strftime('%B %d, %Y')}. "
             f"The assessment evaluated the organization's VM program across five key dimensions: "
             f"scanner health, credential coverage, asset lifecycle management, tagging governance, "
-            f"and scan policy adherence.\n\n"
+            "and scan policy adherence.",
             f"The program achieved a maturity score of {s.maturity_score}/5.0, classified as "
             f"<b>{s.maturity_level.value}</b>. Of the {len(s.findings)} findings identified, "
-            f"{len(s.critical_findings)} are Critical and {len(s.high_findings)} are High severity, "
+            f"{counts[Severity.CRITICAL]} are Critical and {counts[Severity.HIGH]} are High severity, "
             f"requiring immediate attention. Authenticated scan coverage stands at "
             f"{s.authenticated_scans_pct:.1f}%, well below the industry benchmark of 90%+, "
-            f"meaning the organization may be detecting fewer than 40% of actual vulnerabilities.\n\n"
+            f"meaning the organization may be detecting fewer than 40% of actual vulnerabilities.",
             f"MPIV Partners recommends a structured 90-day remediation roadmap beginning with "
             f"quick-win items achievable within 30 days. Strategic and long-term roadmap items "
             f"should be addressed in subsequent phases with dedicated project sponsorship and "
-            f"executive visibility."
-        )
+            f"executive visibility.",
+        ]
 
     # ── MATURITY ──────────────────────────────────────────────────────────────
     def _maturity(self):
         els = [Spacer(1, 0.4*cm),
                Paragraph("2. Maturity Assessment", STYLES["section_title"]), _divider()]
         s = self.summary
+        n_critical = self._sev_counts[Severity.CRITICAL]
 
-        levels = [
-            ("1.0-1.9", "Initial",    "#C62828"),
-            ("2.0-2.9", "Developing", "#EF6C00"),
-            ("3.0-3.9", "Defined",    "#F9A825"),
-            ("4.0-4.9", "Managed",    "#388E3C"),
-            ("5.0",     "Optimized",  "#1565C0"),
-        ]
         gauge_cells = []
         gauge_style = [
             ("ALIGN",   (0,0),(-1,-1), "CENTER"),
             ("TOPPADDING",    (0,0),(-1,-1), 10),
             ("BOTTOMPADDING", (0,0),(-1,-1), 10),
         ]
-        for i, (rng, label, hx) in enumerate(levels):
+        for i, (rng, label, color) in enumerate(_MATURITY_LEVELS):
             is_cur = s.maturity_level.value == label
             marker = ">" if is_cur else ""
             gauge_cells.append(Paragraph(
                 f"<b>{marker} {label}</b><br/>{rng}",
-                ParagraphStyle("g", fontName="Helvetica-Bold" if is_cur else "Helvetica",
-                    fontSize=8 if not is_cur else 9,
-                    textColor=MPIV_WHITE, alignment=TA_CENTER, leading=12)
+                STYLES["gauge_current" if is_cur else "gauge"]
             ))
-            gauge_style.append(("BACKGROUND", (i,0),(i,0), colors.HexColor(hx)))
+            gauge_style.append(("BACKGROUND", (i,0),(i,0), color))
             if is_cur:
                 gauge_style.append(("BOX", (i,0),(i,0), 2.5, MPIV_WHITE))
 
-        col_w = (PAGE_W - 2*MARGIN) / 5
-        gauge = Table([gauge_cells], colWidths=[col_w]*5)
+        gauge = Table([gauge_cells], colWidths=GAUGE_COLS)
         gauge.setStyle(TableStyle(gauge_style))
         els.append(gauge)
         els.append(Spacer(1, 0.4*cm))
 
-        score_color = ("#2E7D32" if s.maturity_score >= 3.5
-                       else "#F9A825" if s.maturity_score >= 2.5 else "#C62828")
+        score_color = _score_hex(s.maturity_score)
         metrics = [
             ["Metric", "Value", "Benchmark", "Status"],
             ["Maturity Score",
@@ -333,24 +514,15 @@ class PDFReportGenerator:
              ">=90%", "OK" if s.authenticated_scans_pct >= 90 else "FAIL"],
             ["Scanner Health", f"{s.scanner_health_pct:.1f}%",
              ">=95%", "OK" if s.scanner_health_pct >= 95 else "FAIL"],
-            ["Critical Findings", str(len(s.critical_findings)),
-             "0", "OK" if not s.critical_findings else "FAIL"],
+            ["Critical Findings", str(n_critical),
+             "0", "OK" if not n_critical else "FAIL"],
             ["Total Findings", str(len(s.findings)), "-", "-"],
         ]
-        m_data = [[Paragraph(str(c), STYLES["table_header" if r == 0 else "table_cell"])
-                   for c in row] for r, row in enumerate(metrics)]
-        m_t = Table(m_data, colWidths=[6.5*cm, 3*cm, 3*cm, 2.5*cm], repeatRows=1)
-        m_t.setStyle(TableStyle([
-            ("BACKGROUND",    (0,0),(-1,0), MPIV_NAVY),
-            ("TEXTCOLOR",     (0,0),(-1,0), MPIV_WHITE),
-            ("ROWBACKGROUNDS",(0,1),(-1,-1), [MPIV_WHITE, MPIV_GRAY]),
-            ("GRID",          (0,0),(-1,-1), 0.3, colors.HexColor("#C8D8F0")),
-            ("ALIGN",         (1,0),(-1,-1), "CENTER"),
-            ("VALIGN",        (0,0),(-1,-1), "MIDDLE"),
-            ("TOPPADDING",    (0,0),(-1,-1), 7),
-            ("BOTTOMPADDING", (0,0),(-1,-1), 7),
-            ("LEFTPADDING",   (0,0),(-1,-1), 8),
-        ]))
+        # Solo la celda del score lleva markup; el resto son strings planos
+        # (sin parseo de Paragraph) y se estilan con comandos de TableStyle
+        metrics[1][1] = Paragraph(metrics[1][1], STYLES["table_cell_center"])
+        m_t = Table(metrics, colWidths=[6.5*cm, 3*cm, 3*cm, 2.5*cm], repeatRows=1)
+        m_t.setStyle(_METRICS_STYLE)
         els.append(m_t)
         return els
 
@@ -358,20 +530,18 @@ class PDFReportGenerator:
     def _findings(self):
         els = [Paragraph("3. Detailed Findings", STYLES["section_title"]), _divider()]
         s = self.summary
-        sev_order = {"critical":0, "high":1, "medium":2, "low":3}
-        findings = sorted(s.findings, key=lambda f: sev_order.get(f.severity.value, 9))
-        sev_colors_map = {"critical": SEV_CRITICAL, "high": SEV_HIGH,
-                          "medium": SEV_MEDIUM, "low": SEV_LOW}
-
-        from collections import Counter
-        counts = Counter(f.severity.value for f in findings)
-        cw = (PAGE_W - 2*MARGIN) / 4
+        if not s.findings:
+            # Sin findings no hay strip, tabla ni tarjetas que armar
+            els.append(Paragraph("No findings identified during this assessment.", STYLES["body"]))
+            return els
+        findings = sorted(s.findings, key=_sev_rank)
+
+        counts = self._sev_counts
         count_t = Table([[
-            Paragraph(f'<b><font color="#C62828">{counts.get("critical",0)}</font></b><br/><font size="7">Critical</font>', STYLES["body_center"]),
-            Paragraph(f'<b><font color="#EF6C00">{counts.get("high",0)}</font></b><br/><font size="7">High</font>', STYLES["body_center"]),
-            Paragraph(f'<b><font color="#F9A825">{counts.get("medium",0)}</font></b><br/><font size="7">Medium</font>', STYLES["body_center"]),
-            Paragraph(f'<b><font color="#2E7D32">{counts.get("low",0)}</font></b><br/><font size="7">Low</font>', STYLES["body_center"]),
-        ]], colWidths=[cw]*4)
+            Paragraph(f'<b><font color="{SEV_HEX[sev.value]}">{counts[sev]}</font></b>'
+                      f'<br/><font size="7">{sev.value.title()}</font>', STYLES["body_center"])
+            for sev in (Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW)
+        ]], colWidths=SEV_COLS)
         count_t.setStyle(TableStyle([
             ("BACKGROUND", (0,0),(-1,-1), MPIV_LIGHT),
             ("ALIGN",      (0,0),(-1,-1), "CENTER"),
@@ -383,60 +553,40 @@ class PDFReportGenerator:
         els.append(Spacer(1, 0.4*cm))
 
         # Summary table
-        rows = [["ID", "Severity", "Category", "Title", "Effort"]]
-        for f in findings:
-            rows.append([f.id, f.severity.value.upper(), f.category.value, f.title, f.effort.upper()])
-        t_data = [[Paragraph(c, STYLES["table_header" if r == 0 else "table_cell"])
-                   for c in row] for r, row in enumerate(rows)]
-        f_t = Table(t_data, colWidths=[1.2*cm, 2.2*cm, 3.8*cm, 6.3*cm, 1.8*cm], repeatRows=1)
-        f_style = [
-            ("BACKGROUND",    (0,0),(-1,0), MPIV_NAVY),
-            ("TEXTCOLOR",     (0,0),(-1,0), MPIV_WHITE),
-            ("ROWBACKGROUNDS",(0,1),(-1,-1), [MPIV_WHITE, MPIV_GRAY]),
-            ("GRID",          (0,0),(-1,-1), 0.3, colors.HexColor("#C8D8F0")),
-            ("ALIGN",         (0,0),(1,-1), "CENTER"),
-            ("ALIGN",         (4,0),(4,-1), "CENTER"),
-            ("VALIGN",        (0,0),(-1,-1), "MIDDLE"),
-            ("TOPPADDING",    (0,0),(-1,-1), 6),
-            ("BOTTOMPADDING", (0,0),(-1,-1), 6),
-            ("LEFTPADDING",   (0,0),(-1,-1), 6),
-        ]
+        # Solo Title puede necesitar varias líneas: el resto va como string plano
+        # Una sola pasada arma filas, color por fila y los datos de las tarjetas
+        cell = STYLES["table_cell"]
+        t_data = [["ID", "Severity", "Category", "Title", "Effort"]]
+        f_style = list(_FINDINGS_BASE_STYLE)
+        cards = []
         for i, f in enumerate(findings, 1):
-            c = sev_colors_map.get(f.severity.value, MPIV_DARK)
-            f_style += [("TEXTCOLOR", (1,i),(1,i), c), ("FONTNAME", (1,i),(1,i), "Helvetica-Bold")]
+            sev, color = _SEV_LABEL[f.severity]
+            eff = f.effort.upper()
+            t_data.append([f.id, sev, f.category.value, Paragraph(f.title, cell), eff])
+            f_style.append(("TEXTCOLOR", (1,i),(1,i), color))
+            cards.append((f, sev, eff, color))
+        f_t = Table(t_data, colWidths=[1.2*cm, 2.2*cm, 3.8*cm, 6.3*cm, 1.8*cm], repeatRows=1)
         f_t.setStyle(TableStyle(f_style))
         els.append(f_t)
 
         # Detail cards
         els.append(Spacer(1, 0.6*cm))
         els.append(Paragraph("Finding Details", STYLES["subsection"]))
-        for f in findings:
-            sev_c = sev_colors_map.get(f.severity.value, MPIV_DARK)
+        # Estilos y constantes ligados a locales fuera del loop de tarjetas
+        title_st, badge_st = STYLES["finding_title"], STYLES["sev_badge"]
+        cell_st, body_st = STYLES["table_cell"], STYLES["body"]
+        gap = 0.3*cm
+        for f, sev, eff, color in cards:
             card = Table([
-                [Paragraph(f"<b>{f.id}</b> — {f.title}", STYLES["finding_title"]),
-                 Paragraph(f.severity.value.upper(), ParagraphStyle("sev",
-                     fontName="Helvetica-Bold", fontSize=8,
-                     textColor=MPIV_WHITE, alignment=TA_CENTER))],
-                [Paragraph(f"<b>Category:</b> {f.category.value}  |  <b>Effort:</b> {f.effort.upper()}", STYLES["table_cell"]), ""],
-                [Paragraph(f"<b>Description:</b> {f.description}", STYLES["body"]), ""],
-                [Paragraph(f"<b>Evidence:</b> {f.evidence or 'N/A'}", STYLES["body"]), ""],
-                [Paragraph(f"<b>Recommendation:</b> {f.recommendation}", STYLES["body"]), ""],
-            ], colWidths=[PAGE_W - 2*MARGIN - 2.5*cm, 2.5*cm])
-            card.setStyle(TableStyle([
-                ("BACKGROUND",   (0,0),(-1,0), MPIV_LIGHT),
-                ("BACKGROUND",   (1,0),(1,0), sev_c),
-                ("SPAN",         (0,1),(1,1)),
-                ("SPAN",         (0,2),(1,2)),
-                ("SPAN",         (0,3),(1,3)),
-                ("SPAN",         (0,4),(1,4)),
-                ("BOX",          (0,0),(-1,-1), 0.8, colors.HexColor("#C8D8F0")),
-                ("LINEBELOW",    (0,0),(-1,0), 0.5, colors.HexColor("#C8D8F0")),
-                ("TOPPADDING",   (0,0),(-1,-1), 6),
-                ("BOTTOMPADDING",(0,0),(-1,-1), 6),
-                ("LEFTPADDING",  (0,0),(-1,-1), 8),
-                ("VALIGN",       (0,0),(-1,-1), "MIDDLE"),
-            ]))
-            els.append(KeepTogether([card, Spacer(1, 0.3*cm)]))
+                [Paragraph(f"<b>{f.id}</b> — {f.title}", title_st),
+                 Paragraph(sev, badge_st)],
+                [Paragraph(f"<b>Category:</b> {f.category.value}  |  <b>Effort:</b> {eff}", cell_st), ""],
+                [Paragraph(f"<b>Description:</b> {f.description}", body_st), ""],
+                [Paragraph(f"<b>Evidence:</b> {f.evidence or 'N/A'}", body_st), ""],
+                [Paragraph(f"<b>Recommendation:</b> {f.recommendation}", body_st), ""],
+            ], colWidths=_CARD_COLS)
+            card.setStyle(TableStyle(_CARD_BASE_STYLE + (("BACKGROUND", (1,0),(1,0), color),)))
+            els.append(KeepTogether([card, Spacer(1, gap)]))
         return els
 
     # ── ROADMAP ───────────────────────────────────────────────────────────────
@@ -446,50 +596,45 @@ class PDFReportGenerator:
             "Remediation activities are organized into three phases based on complexity and impact. "
             "Quick-win items deliver immediate program improvement with minimal effort.",
             STYLES["body"]))
+        if not self.summary.recommendations:
+            els.append(Paragraph("No remediation items were required for this assessment.",
+                                 STYLES["body"]))
+            return els
         els.append(Spacer(1, 0.4*cm))
 
-        phases = [
-            ("30 Days", "Quick Wins", MPIV_NAVY,  "quick-win"),
-            ("60 Days", "Strategic",  MPIV_BLUE,  "strategic"),
-            ("90 Days", "Roadmap",    MPIV_ACCENT,"roadmap"),
-        ]
-        type_map = {"quick-win": 0, "strategic": 1, "roadmap": 2}
         buckets = [[], [], []]
         for r in self.summary.recommendations:
-            buckets[type_map.get(r.type, 2)].append(r)
+            buckets[_PHASE_INDEX.get(r.type, 2)].append(r)
 
-        ph_w = (PAGE_W - 2*MARGIN) / 3
         # Header
         ph_header = Table([[
-            Paragraph(f"<b>{p[0]}</b><br/>{p[1]}", ParagraphStyle(
-                "ph", fontName="Helvetica-Bold", fontSize=11,
-                textColor=MPIV_WHITE, alignment=TA_CENTER, leading=16))
-            for p in phases
-        ]], colWidths=[ph_w]*3)
+            Paragraph(f"<b>{p[0]}</b><br/>{p[1]}", STYLES["phase_header"])
+            for p in _PHASES
+        ]], colWidths=PHASE_COLS)
         ph_style = [("TOPPADDING",(0,0),(-1,-1),12), ("BOTTOMPADDING",(0,0),(-1,-1),12),
                     ("ALIGN",(0,0),(-1,-1),"CENTER")]
-        for i, p in enumerate(phases):
+        for i, p in enumerate(_PHASES):
             ph_style.append(("BACKGROUND",(i,0),(i,0), p[2]))
         ph_header.setStyle(TableStyle(ph_style))
         els.append(ph_header)
 
         # Content
         bucket_content = []
+        item_st, sub_st = STYLES["roadmap_item"], STYLES["roadmap_sub"]
         for bucket in buckets:
             items = []
             if bucket:
                 for r in bucket:
-                    items.append(Paragraph(f"<b>#{r.priority}</b> {r.title}", STYLES["roadmap_item"]))
-                    for line in r.description.split("\n"):
-                        if line.strip():
-                            items.append(Paragraph(f"  {line.strip()}", ParagraphStyle(
-                                "ri2", fontName="Helvetica", fontSize=7.5,
-                                textColor=colors.HexColor("#555555"), leading=11, leftIndent=8)))
+                    items.append(Paragraph(f"<b>#{r.priority}</b> {r.title}", item_st))
+                    # Todas las líneas de la descripción en un solo Paragraph
+                    lines = _description_lines(r.description)
+                    if lines:
+                        items.append(Paragraph("<br/>".join(lines), sub_st))
             else:
                 items = [Paragraph("No items in this phase.", STYLES["roadmap_item"])]
             bucket_content.append(items)
 
-        content_t = Table([bucket_content], colWidths=[ph_w]*3)
+        content_t = Table([bucket_content], colWidths=PHASE_COLS)
         content_t.setStyle(TableStyle([
             ("BACKGROUND",    (0,0),(-1,-1), MPIV_WHITE),
             ("VALIGN",        (0,0),(-1,-1), "TOP"),
@@ -506,27 +651,16 @@ class PDFReportGenerator:
     # ── NEXT STEPS ────────────────────────────────────────────────────────────
     def _next_steps(self):
         els = [Paragraph("5. Next Steps & Acceptance", STYLES["section_title"]), _divider()]
-        for num, step in [
+        step_st = STYLES["next_steps"]
+        steps = Table([[num, Paragraph(step, step_st)] for num, step in [
             ("1", "Schedule remediation kickoff meeting with IT Security and Operations teams within 5 business days."),
             ("2", "Assign owners to each Critical and High finding within 5 business days."),
             ("3", "Implement Quick-Win items (30-day phase) with MPIV Partners advisory support."),
             ("4", "Establish bi-weekly progress reviews for the 60-day strategic phase."),
             ("5", "Schedule 90-day follow-up assessment to validate maturity score improvement."),
-        ]:
-            row = Table([[Paragraph(f"<b>{num}</b>", STYLES["body_center"]),
-                          Paragraph(step, STYLES["next_steps"])]],
-                        colWidths=[0.8*cm, PAGE_W - 2*MARGIN - 0.8*cm])
-            row.setStyle(TableStyle([
-                ("BACKGROUND",    (0,0),(0,0), MPIV_NAVY),
-                ("TEXTCOLOR",     (0,0),(0,0), MPIV_WHITE),
-                ("ALIGN",         (0,0),(0,0), "CENTER"),
-                ("VALIGN",        (0,0),(-1,-1), "MIDDLE"),
-                ("TOPPADDING",    (0,0),(-1,-1), 6),
-                ("BOTTOMPADDING", (0,0),(-1,-1), 6),
-                ("LEFTPADDING",   (0,0),(-1,-1), 6),
-                ("LINEBELOW",     (0,0),(-1,-1), 0.3, colors.HexColor("#CCCCCC")),
-            ]))
-            els.append(row)
+        ]], colWidths=(0.8*cm, CONTENT_W - 0.8*cm))
+        steps.setStyle(_NEXT_STEPS_STYLE)
+        els.append(steps)
 
         els.append(Spacer(1, 1.5*cm))
         els.append(Paragraph("Document Acceptance", STYLES["subsection"]))
@@ -536,7 +670,6 @@ class PDFReportGenerator:
             STYLES["body"]))
         els.append(Spacer(1, 1.2*cm))
 
-        half = (PAGE_W - 2*MARGIN) / 2
         sig_t = Table([
             [Paragraph("<b>MPIV Partners</b>", STYLES["body_center"]),
              Paragraph(f"<b>{self.summary.customer_name}</b>", STYLES["body_center"])],
@@ -550,7 +683,7 @@ class PDFReportGenerator:
              Paragraph("Title: _______________________", STYLES["body"])],
             [Paragraph(f"Date:  {self.summary.assessment_date.strftime('%B %d, %Y')}", STYLES["body"]),
              Paragraph("Date:  _______________________", STYLES["body"])],
-        ], colWidths=[half, half])
+        ], colWidths=HALF_COLS)
         sig_t.setStyle(TableStyle([
             ("BACKGROUND",    (0,0),(-1,0), MPIV_LIGHT),
             ("ALIGN",         (0,0),(-1,1), "CENTER"),
@@ -1,3 +1,7 @@
+import hashlib
+import json
+import time
+
 from loguru import logger
 from config.settings import settings
 from models.assessment import AssessmentSummary
@@ -7,16 +11,45 @@ class AINarrativeEngine:
         self.enabled = settings.is_openai_configured()
         if not self.enabled:
             logger.warning("AI Narrative disabled — OPENAI_API_KEY not set.")
+        # Respuestas previas por hash de (modelo, prompt): regenerar el mismo
+        # informe no vuelve a llamar a OpenAI
+        self.cache_dir = settings.CACHE_DIR / "narratives"
+        # Cliente OpenAI reutilizado entre llamadas (pool keep-alive de httpx);
+        # se crea en el primer uso para que un hit de cache no importe openai
+        self._client = None
 
     def generate(self, summary: AssessmentSummary) -> str:
         if not self.enabled:
             return self._fallback(summary)
+        prompt = self._prompt(summary)
+        key = hashlib.sha256(f"{settings.OPENAI_MODEL}\n{prompt}".encode()).hexdigest()
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.info("AI narrative served from cache.")
+            return cached
         try:
+            response = self._openai().chat.completions.create(
+                model=settings.OPENAI_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.4, max_tokens=800,
+            )
+            text = response.choices[0].message.content.strip()
+        except Exception as e:
+            logger.error(f"OpenAI error: {e}")
+            return self._fallback(summary)
+        self._cache_set(key, text)
+        return text
+
+    def _openai(self):
+        if self._client is None:
             from openai import OpenAI
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
-            recs = "\n".join(f"{i+1}. {r.title}"
-                            for i, r in enumerate(summary.recommendations[:5]))
-            prompt = f"""You are a senior cybersecurity consultant from MPIV.
+            self._client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        return self._client
+
+    def _prompt(self, summary):
+        recs = "\n".join(f"{i+1}. {r.title}"
+                        for i, r in enumerate(summary.recommendations[:5]))
+        return f"""You are a senior cybersecurity consultant from MPIV.
 Write a 4-paragraph executive summary for {summary.customer_name}.
 Maturity: {summary.maturity_level.value} ({summary.maturity_score}/5.0)
 Assets: {summary.total_assets}
@@ -27,15 +60,29 @@ Top recommendations:
 {recs}
 Write in formal English prose. No bullet points."""
 
-            response = client.chat.completions.create(
-                model=settings.OPENAI_MODEL,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.4, max_tokens=800,
-            )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"OpenAI error: {e}")
-            return self._fallback(summary)
+    def _cache_get(self, key):
+        path = self.cache_dir / f"{key}.json"
+        # Una entrada ilegible o con otra forma cuenta como miss
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            created, text = entry["created"], entry["text"]
+            if (not isinstance(text, str) or isinstance(created, bool)
+                    or not isinstance(created, (int, float))):
+                return None
+            if time.time() - created > settings.NARRATIVE_CACHE_TTL:
+                return None
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return None
+        return text
+
+    def _cache_set(self, key, text):
+        # Un fallo de cache nunca debe romper el assessment
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / f"{key}.json").write_text(
+                json.dumps({"created": time.time(), "text": text}), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Narrative cache write failed: {e}")
 
     def _fallback(self, summary):
         return (
@@ -46,4 +93,4 @@ Write in formal English prose. No bullet points."""
             f"Maturity level: {summary.maturity_level.value} ({summary.maturity_score}/5.0).\n\n"
             f"Immediate action is required on critical findings. MPIV recommends a "
             f"structured 90-day remediation roadmap beginning with quick-win items."
-        )
\ No newline at end of file
+        )
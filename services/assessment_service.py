@@ -17,13 +17,14 @@ class AssessmentService:
     def run(self) -> AssessmentSummary:
         logger.info(f"Assessment started for: {settings.CUSTOMER_NAME}")
 
-        scanners    = self.client.get_scanners()
-        assets      = self.client.get_assets()
-        scans       = self.client.get_scans()
-        policies    = self.client.get_policies()
-        tags        = self.client.get_tags()
-        credentials = self.client.get_credentials()
-        networks    = self.client.get_networks()
+        data        = self.client.fetch_all()
+        scanners    = data["scanners"]
+        assets      = data["assets"]
+        scans       = data["scans"]
+        policies    = data["policies"]
+        tags        = data["tags"]
+        credentials = data["credentials"]
+        networks    = data["networks"]
 
         findings = GapAnalyzer(
             scanners, assets, scans, policies, tags, credentials, networks